@@ -0,0 +1,232 @@
+"""
+Reproducible benchmark for the word ladder search algorithms.
+
+    python benchmarks/bench_search.py --output bench.json
+    python benchmarks/bench_search.py --compare bench.json
+
+Every solver runs over the same seeded start/target pairs for each word
+length. For each (solver, length) the harness records wall time,
+expanded words, peak frontier size, peak traced memory and the ladders
+found, and writes the numbers as JSON. --compare checks a new run against
+a saved one and exits non-zero if a solver got slower, expanded more words
+or found different ladders.
+Expansion counts depend on set iteration order, so the script re-runs
+itself with PYTHONHASHSEED=0 unless a hash seed is already set.
+"""
+import argparse
+import contextlib
+import functools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Make the project modules (and their data files) reachable from anywhere
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import word_graph
+from word_loader import load_dictionary
+
+def _compact_bfs(start, target, word_list, max_time=5.0, observer=None):
+    return word_graph.load_compact_graph().shortest_path(start, target, "bfs")
+
+# Register new solvers here; each takes (start, target, word_list, max_time=..., observer=...)
+SOLVERS = {
+    "bfs": word_graph.bidirectional_bfs,
+    "bfs-classic": word_graph.optimized_bfs,
+    "astar": word_graph.a_star_search,
+    "astar-refined": functools.partial(word_graph.a_star_search, refined=True),
+    "ucs": word_graph.ucs_shortest_path,
+    "compact-bfs": _compact_bfs,
+}
+
+def generate_pairs(dictionary, lengths, pairs_per_length, seed):
+    """Pick the same reachable start/target pairs for every run with the same seed"""
+    pairs = {}
+    for length in lengths:
+        # Seeded per length, so running a subset of lengths picks the same pairs
+        rng = random.Random(f"{seed}-{length}")
+        words = dictionary.words_of_length(length)
+        selected = []
+        attempts = 0
+        while len(selected) < pairs_per_length and attempts < pairs_per_length * 100:
+            attempts += 1
+            start, target = rng.sample(words, 2)
+            if word_graph.same_component(start, target, dictionary):
+                selected.append((start, target))
+        pairs[length] = selected
+    return pairs
+
+def run_solver(name, solver, pairs, dictionary, max_time):
+    """Benchmark one solver on one list of pairs"""
+    timings = []
+    found = 0
+    total_steps = 0
+    path_lengths = []
+
+    # Timed pass: cold neighbor cache, warm index
+    word_graph.neighbor_cache.clear()
+    instrumented = name != "compact-bfs"
+    expansions = 0
+    peak_frontier = 0
+    for start, target in pairs:
+        metrics = word_graph.SearchMetrics()
+        start_time = time.perf_counter()
+        path = solver(start, target, dictionary, max_time=max_time, observer=metrics)
+        timings.append((time.perf_counter() - start_time) * 1000)
+        expansions += metrics.expansions
+        peak_frontier = max(peak_frontier, metrics.peak_frontier)
+        path_lengths.append(len(path) - 1 if path else None)
+        if path:
+            found += 1
+            total_steps += len(path) - 1
+
+    # Memory pass, kept separate because tracing distorts the timings
+    word_graph.neighbor_cache.clear()
+    peak_memory = 0
+    tracemalloc.start()
+    try:
+        for start, target in pairs:
+            tracemalloc.reset_peak()
+            solver(start, target, dictionary, max_time=max_time)
+            peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "solver": name,
+        "pairs": len(pairs),
+        "found": found,
+        "total_steps": total_steps,
+        "path_lengths": path_lengths,
+        "wall_ms_total": round(sum(timings), 3),
+        "wall_ms_mean": round(statistics.mean(timings), 3) if timings else 0.0,
+        "wall_ms_p95": round(sorted(timings)[int(0.95 * (len(timings) - 1))], 3) if timings else 0.0,
+        "expansions": expansions if instrumented else None,
+        "peak_frontier": peak_frontier if instrumented else None,
+        "peak_memory_kb": round(peak_memory / 1024, 1),
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=PROJECT_ROOT).stdout.strip() or None
+    except OSError:
+        return None
+
+def run_benchmark(solvers, lengths, pairs_per_length, seed, max_time):
+    with contextlib.redirect_stdout(sys.stderr):
+        dictionary = load_dictionary()
+        pairs = generate_pairs(dictionary, lengths, pairs_per_length, seed)
+
+        # Build indexes up front so they are not charged to the first solver
+        index = word_graph.get_neighbor_index(dictionary)
+        for length in lengths:
+            index.prepare(length)
+        if "compact-bfs" in solvers:
+            word_graph.load_compact_graph()
+
+        results = []
+        for length in lengths:
+            for name in solvers:
+                result = run_solver(name, SOLVERS[name], pairs[length], dictionary, max_time)
+                result["length"] = length
+                results.append(result)
+                print(f"{name:>14} len={length} found={result['found']}/{result['pairs']} "
+                      f"mean={result['wall_ms_mean']:.2f}ms expansions={result['expansions']}")
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "hash_seed": os.environ.get("PYTHONHASHSEED"),
+            "pairs_per_length": pairs_per_length,
+            "lengths": lengths,
+            "max_time": max_time,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def compare(baseline, current, time_tolerance, expansion_tolerance):
+    """Return a list of human-readable regressions of current against baseline"""
+    previous = {(r["solver"], r["length"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        key = (result["solver"], result["length"])
+        old = previous.get(key)
+        if old is None:
+            continue
+        label = f"{result['solver']} (length {result['length']})"
+        if result["path_lengths"] != old["path_lengths"]:
+            regressions.append(f"{label}: ladders changed (found {old['found']} -> {result['found']}, "
+                               f"steps {old['total_steps']} -> {result['total_steps']})")
+        if old["wall_ms_mean"] > 0 and result["wall_ms_mean"] > old["wall_ms_mean"] * time_tolerance:
+            regressions.append(f"{label}: mean time {old['wall_ms_mean']:.2f}ms -> {result['wall_ms_mean']:.2f}ms")
+        if old["expansions"] and result["expansions"] is not None \
+                and result["expansions"] > old["expansions"] * expansion_tolerance:
+            regressions.append(f"{label}: expansions {old['expansions']} -> {result['expansions']}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the word ladder search algorithms")
+    parser.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--lengths", nargs="+", type=int, default=[3, 4, 5, 6, 7, 8])
+    parser.add_argument("--pairs", type=int, default=10, help="Pairs per word length")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--max-time", type=float, default=5.0, help="Time limit per search in seconds")
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout)")
+    parser.add_argument("--compare", help="Saved JSON report to check this run against")
+    parser.add_argument("--time-tolerance", type=float, default=1.25,
+                        help="Allowed slowdown factor before a time regression is reported")
+    parser.add_argument("--expansion-tolerance", type=float, default=1.0,
+                        help="Allowed growth factor in expanded words")
+    args = parser.parse_args(argv)
+
+    # Resolve output paths before switching to the project root, where the word files live
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.compare) if args.compare else None
+    os.chdir(PROJECT_ROOT)
+
+    report = run_benchmark(args.solvers, args.lengths, args.pairs, args.seed, args.max_time)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        if baseline["meta"]["seed"] != args.seed or baseline["meta"]["pairs_per_length"] != args.pairs:
+            print("Warning: baseline was run with a different seed or pair count", file=sys.stderr)
+        if baseline["meta"].get("hash_seed") != report["meta"]["hash_seed"]:
+            print("Warning: baseline was run with a different PYTHONHASHSEED; expansions may differ",
+                  file=sys.stderr)
+        regressions = compare(baseline, report, args.time_tolerance, args.expansion_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions against {baseline_path}.", file=sys.stderr)
+    return 0
+
+def pin_hash_seed(hash_seed="0"):
+    """Re-run this script under a fixed PYTHONHASHSEED, unless one is set already"""
+    if os.environ.get("PYTHONHASHSEED") is None:
+        os.environ["PYTHONHASHSEED"] = hash_seed
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+
+if __name__ == "__main__":
+    pin_hash_seed()
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Streaming build of the word graph artifact from arbitrary word lists.
+
+    python dictionary_builder.py words_alpha.txt
+    python dictionary_builder.py big_list.txt.gz extra.txt --max-length 12 --output big_graph.bin
+    zcat wiki_words.gz | python dictionary_builder.py - --output wiki_graph.bin
+
+Words are read one line at a time from any number of text files, gzip files
+(by .gz suffix) or stdin ('-'). Each one is normalized to lowercase NFC and
+kept only if it is all letters (any script) and within the length limits.
+Words are spilled to one temporary file per length, so nothing but the
+current line is held while reading. Each length bucket is then loaded on
+its own, deduplicated and sorted. Its adjacency, components and letter
+masks are built, and its sections are appended to temporary section files.
+Finally the sections are concatenated into the artifact. Peak memory is set
+by the largest single length bucket, not by the whole word list.
+"""
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+import unicodedata
+from array import array
+from word_loader import (GRAPH_ARTIFACT, encode_word_bucket, write_graph_artifact, letter_masks,
+                         _uint32_array)
+from word_graph import bucket_csr, bucket_components
+
+CHUNK_SIZE = 1024 * 1024
+
+def read_lines(sources):
+    """Yield lines from files, gzip files and stdin ('-'), decoded as UTF-8"""
+    for source in sources:
+        if source == "-":
+            yield from sys.stdin
+        elif source.endswith(".gz"):
+            with gzip.open(source, "rt", encoding="utf-8", errors="replace") as f:
+                yield from f
+        else:
+            with open(source, "r", encoding="utf-8", errors="replace") as f:
+                yield from f
+
+def normalize_word(line, min_length=3, max_length=8):
+    """Return the lowercase NFC form of a word, or None if it should be skipped"""
+    word = unicodedata.normalize("NFC", line.strip()).lower()
+    if not (min_length <= len(word) <= max_length) or not word.isalpha():
+        return None
+    return word
+
+class LengthSpill:
+    """
+    Appends words to one temporary file per word length, buffering a bounded
+    number of words in memory between writes.
+    """
+    def __init__(self, directory, buffer_words=100000):
+        self.directory = directory
+        self.buffer_words = buffer_words
+        self._buffers = {}
+        self._buffered = 0
+        self.lengths = set()
+
+    def path(self, length):
+        return os.path.join(self.directory, f"words_{length}.txt")
+
+    def add(self, word):
+        self._buffers.setdefault(len(word), []).append(word)
+        self._buffered += 1
+        if self._buffered >= self.buffer_words:
+            self.flush()
+
+    def flush(self):
+        for length, words in self._buffers.items():
+            with open(self.path(length), "a", encoding="utf-8") as f:
+                f.write("\n".join(words))
+                f.write("\n")
+            self.lengths.add(length)
+        self._buffers = {}
+        self._buffered = 0
+
+    def bucket(self, length):
+        """Return the sorted, deduplicated words of one length"""
+        with open(self.path(length), "r", encoding="utf-8") as f:
+            return sorted({line.rstrip("\n") for line in f})
+
+def _chunks(path):
+    """Read a section file back in fixed-size chunks"""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+def build_artifact(sources, output=GRAPH_ARTIFACT, min_length=3, max_length=8, buffer_words=100000,
+                   temp_dir=None, builder="auto"):
+    """
+    Stream words from sources into a graph artifact at output.
+    builder chooses how each bucket's adjacency is computed (see word_graph.bucket_csr).
+    Returns a summary dict with the number of lines read, words kept, edges and lengths.
+    """
+    start_time = time.time()
+    with tempfile.TemporaryDirectory(prefix="wordladder-build-", dir=temp_dir) as directory:
+        # Pass 1: normalize and spill by length
+        spill = LengthSpill(directory, buffer_words)
+        lines = 0
+        for line in read_lines(sources):
+            lines += 1
+            word = normalize_word(line, min_length, max_length)
+            if word is not None:
+                spill.add(word)
+        spill.flush()
+
+        # Pass 2: one bucket at a time, appending to per-section files
+        section_paths = {name: os.path.join(directory, f"{name}.bin")
+                         for name in ("words", "offsets", "targets", "components", "masks")}
+        sections = {name: open(path, "wb") for name, path in section_paths.items()}
+        length_entries = []
+        word_count = target_count = label_count = 0
+        try:
+            _uint32_array([0]).tofile(sections["offsets"])
+            for length in sorted(spill.lengths):
+                words = spill.bucket(length)
+                if not words:
+                    continue
+                first = word_count
+                local_offsets, local_targets = bucket_csr(words, builder)
+                components, label_count = bucket_components(local_offsets, local_targets, label_count)
+
+                # Shift the bucket's local ids and offsets to their global positions
+                offsets = array('I', (target_count + offset for offset in local_offsets[1:]))
+                targets = array('I', (first + other for other in local_targets))
+
+                width, blob = encode_word_bucket(words, length)
+                sections["words"].write(blob)
+                _uint32_array(offsets).tofile(sections["offsets"])
+                _uint32_array(targets).tofile(sections["targets"])
+                _uint32_array(components).tofile(sections["components"])
+                _uint32_array(letter_masks(words)).tofile(sections["masks"])
+
+                length_entries.append((length, first, len(words), width))
+                word_count += len(words)
+                target_count += len(targets)
+                print(f"  {length}-letter words: {len(words)} words, {len(targets) // 2} edges")
+        finally:
+            for f in sections.values():
+                f.close()
+
+        # Pass 3: stitch the sections together behind the header
+        write_graph_artifact(output, word_count, target_count, length_entries,
+                             *(_chunks(section_paths[name])
+                               for name in ("words", "offsets", "targets", "components", "masks")))
+
+    summary = {"lines": lines, "words": word_count, "edges": target_count // 2,
+               "lengths": [entry[0] for entry in length_entries]}
+    print(f"Built {output} from {lines} lines: {word_count} words, {summary['edges']} edges "
+          f"in {time.time() - start_time:.2f}s.")
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the word graph artifact from word lists")
+    parser.add_argument("sources", nargs="+", help="Word list files (.gz is decompressed, '-' reads stdin)")
+    parser.add_argument("--output", default=GRAPH_ARTIFACT)
+    parser.add_argument("--min-length", type=int, default=3)
+    parser.add_argument("--max-length", type=int, default=8)
+    parser.add_argument("--buffer-words", type=int, default=100000,
+                        help="Words buffered in memory before spilling to disk")
+    parser.add_argument("--temp-dir", help="Where to put the temporary spill files")
+    parser.add_argument("--builder", choices=["auto", "python", "numpy"], default="auto",
+                        help="How to compute adjacency (auto uses NumPy when installed)")
+    args = parser.parse_args(argv)
+
+    build_artifact(args.sources, args.output, args.min_length, args.max_length,
+                   args.buffer_words, args.temp_dir, args.builder)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
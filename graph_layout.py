@@ -0,0 +1,185 @@
+"""
+Incremental layouts for the word ladder subgraphs shown in the UI.
+
+Node positions are remembered per game session, keyed by the session's
+(start, target) pair. Between moves the displayed subgraph only gains or
+loses a handful of words, so known words keep their positions. Only new
+words are placed, next to their already placed neighbors, and relaxed with
+a short spring layout while everything else stays fixed. This is cheaper
+than a full layout and keeps the picture from jumping.
+Positions for pinned pairs (the built-in GAME_MODES puzzles) are never
+evicted, so replaying a puzzle reuses its layout from the start.
+"""
+import random
+import threading
+from collections import OrderedDict
+import networkx as nx
+from word_graph import get_word_neighbors
+
+class LayoutCache:
+    def __init__(self, pinned_pairs=(), max_sessions=16, max_nodes=400, seed=42):
+        self.pinned_pairs = set(pinned_pairs)
+        self.max_sessions = max_sessions  # Unpinned sessions kept, least recently used first out
+        self.max_nodes = max_nodes        # Positions remembered per session
+        self.seed = seed
+        self._sessions = OrderedDict()    # (start, target) -> {word: (x, y)}
+        self._lock = threading.Lock()
+        self.full_layouts = 0
+        self.incremental_layouts = 0
+        self.reused_layouts = 0
+
+    def _positions_for(self, key):
+        with self._lock:
+            positions = self._sessions.get(key)
+            if positions is None:
+                positions = {}
+                self._sessions[key] = positions
+            self._sessions.move_to_end(key)
+            unpinned = [k for k in self._sessions if k not in self.pinned_pairs]
+            for old_key in unpinned[:max(0, len(unpinned) - self.max_sessions)]:
+                del self._sessions[old_key]
+            return positions
+
+    def layout(self, graph, key):
+        """Return {node: (x, y)} for graph, reusing and extending the positions stored for key"""
+        positions = self._positions_for(key)
+        known = [node for node in graph if node in positions]
+        new = [node for node in graph if node not in positions]
+
+        if not known:
+            self.full_layouts += 1
+            layout = nx.spring_layout(graph, seed=self.seed)
+        elif not new:
+            self.reused_layouts += 1
+            layout = {node: positions[node] for node in graph}
+        else:
+            self.incremental_layouts += 1
+            layout = self._relax_new_nodes(graph, positions, known, new)
+
+        positions.update((node, tuple(position)) for node, position in layout.items())
+        if len(positions) > self.max_nodes:
+            # Forget positions of words that are no longer displayed
+            for node in [node for node in positions if node not in graph][:len(positions) - self.max_nodes]:
+                del positions[node]
+        return {node: tuple(position) for node, position in layout.items()}
+
+    def _relax_new_nodes(self, graph, positions, known, new):
+        rng = random.Random(f"{self.seed}-{len(known)}-{len(new)}")
+        xs = [positions[node][0] for node in known]
+        ys = [positions[node][1] for node in known]
+        spread = max(max(xs) - min(xs), max(ys) - min(ys), 0.5)
+
+        initial = {node: positions[node] for node in known}
+        for node in new:
+            # Start next to the placed neighbors (or the middle of the picture)
+            placed = [initial[neighbor] for neighbor in graph[node] if neighbor in initial]
+            if placed:
+                x = sum(p[0] for p in placed) / len(placed)
+                y = sum(p[1] for p in placed) / len(placed)
+            else:
+                x, y = sum(xs) / len(xs), sum(ys) / len(ys)
+            initial[node] = (x + rng.uniform(-0.1, 0.1) * spread, y + rng.uniform(-0.1, 0.1) * spread)
+
+        # Known words are pinned, so only the new ones move
+        return nx.spring_layout(graph, pos=initial, fixed=known, k=spread / max(len(graph) ** 0.5, 1),
+                                iterations=30, seed=self.seed)
+
+    def stats(self):
+        with self._lock:
+            return {"sessions": len(self._sessions), "full": self.full_layouts,
+                    "incremental": self.incremental_layouts, "reused": self.reused_layouts}
+
+def layered_exploration(start, target, visited_nodes, path, word_list, max_nodes=200, max_per_layer=30,
+                        max_labels=30, label_layer_size=12):
+    """
+    Level-of-detail view of the words a search visited, for the algorithm popups.
+    Words are grouped into layers by BFS depth from start (within the visited
+    words), and each layer becomes a column. Large layers are sampled so no
+    more than about max_nodes words are drawn. The start, target and path
+    words are always kept, and no column gets more than about max_per_layer
+    words. Within a column, words are ordered by the mean position of their
+    parents, which keeps edges short without running a force-directed
+    layout. The key words are always labelled. Other words are labelled only
+    in columns of at most label_layer_size words, up to max_labels labels.
+    Returns a dict with the subgraph, positions, labels and the number of
+    words hidden per depth.
+    """
+    path = list(path or [])
+    key_words = {start, target} | set(path)
+    visited = set(visited_nodes) | key_words
+
+    # Depth of each visited word, walking only through visited words
+    depth = {start: 0}
+    layers = [[start]]
+    while True:
+        next_layer = []
+        for word in layers[-1]:
+            for neighbor in get_word_neighbors(word, word_list):
+                if neighbor in visited and neighbor not in depth:
+                    depth[neighbor] = len(layers)
+                    next_layer.append(neighbor)
+        if not next_layer:
+            break
+        layers.append(next_layer)
+    # Anything the walk could not reach goes into one extra column
+    unreached = sorted(visited - set(depth))
+    if unreached:
+        for word in unreached:
+            depth[word] = len(layers)
+        layers.append(unreached)
+
+    # Thin the layers to fit the budget: small layers are kept whole and
+    # what is left of the budget is shared evenly among the larger ones
+    layers = [sorted(layer) for layer in layers]
+    rest_sizes = [sum(1 for word in layer if word not in key_words) for layer in layers]
+    budget = max(max_nodes - len(key_words), 0)
+    quotas = {}
+    by_size = sorted(range(len(layers)), key=lambda d: rest_sizes[d])
+    for i, d in enumerate(by_size):
+        keep_count = len(layers[d]) - rest_sizes[d]
+        share = budget // (len(by_size) - i)
+        quotas[d] = min(rest_sizes[d], share, max(max_per_layer - keep_count, 0))
+        budget -= quotas[d]
+
+    shown_layers = []
+    hidden = {}
+    for d, layer in enumerate(layers):
+        keep = [word for word in layer if word in key_words]
+        rest = [word for word in layer if word not in key_words]
+        if quotas[d] < len(rest):
+            # Evenly spaced through the sorted words, so the sample is deterministic
+            step = len(rest) / quotas[d] if quotas[d] else 0
+            hidden[d] = len(rest) - quotas[d]
+            rest = [rest[int(i * step)] for i in range(quotas[d])]
+        shown_layers.append(keep + rest)
+
+    shown = {word for layer in shown_layers for word in layer}
+    graph = nx.Graph()
+    graph.add_nodes_from(shown)
+    for word in shown:
+        for neighbor in get_word_neighbors(word, word_list):
+            if neighbor in shown:
+                graph.add_edge(word, neighbor)
+
+    # Columns by depth; rows ordered by the average row of the previous column's neighbors
+    pos = {}
+    for d, layer in enumerate(shown_layers):
+        def parent_row(word):
+            rows = [pos[n][1] for n in graph[word] if n in pos and depth[n] < d]
+            return sum(rows) / len(rows) if rows else 0.0
+        ordered = sorted(layer, key=lambda word: (parent_row(word), word))
+        count = len(ordered)
+        for i, word in enumerate(ordered):
+            pos[word] = (float(d), (i - (count - 1) / 2) / max(count - 1, 1) if count > 1 else 0.0)
+
+    labels = {word: word for word in key_words if word in shown}
+    for layer in shown_layers:
+        if len(layer) > label_layer_size:
+            continue
+        for word in layer:
+            if len(labels) >= max_labels:
+                break
+            labels.setdefault(word, word)
+
+    return {"graph": graph, "pos": pos, "labels": labels, "depth": depth,
+            "hidden": hidden, "shown": len(shown), "total": len(visited)}
@@ -0,0 +1,237 @@
+"""
+Persistent matplotlib artists for the embedded word ladder graph.
+
+The figure is set up once per game: background, title and legend are
+drawn by a full canvas.draw() and captured as a bitmap. The nodes, edges,
+path arrows and labels are animated artists. On each move they get new
+positions and colors and are blitted over the saved background, instead
+of clearing the figure and redrawing everything. This follows the
+BlitManager pattern from the matplotlib docs. A full redraw only happens
+when the background itself changes (title, legend entries, axis limits)
+or when the canvas redraws after a resize.
+"""
+import math
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.patches import FancyArrowPatch
+
+# role -> (node size, face color, border color, border width, alpha)
+NODE_STYLES = {
+    "other": (650, "#555555", "#777777", 2.0, 0.8),
+    "path": (750, "#3584e4", "#66a5ff", 2.5, 1.0),    # Bright blue with a glow border
+    "start": (950, "#2ecc71", "#87f5b3", 3.0, 1.0),   # Largest, green
+    "target": (950, "#e74c3c", "#ff8b81", 3.0, 1.0),  # Largest, red
+}
+ROLE_ORDER = ["other", "path", "start", "target"]  # Later roles are drawn on top
+
+# kind -> FancyArrowPatch options for the user's path and the suggested path
+ARROW_STYLES = {
+    "path": {"linewidth": 4.0, "color": "#ffaa33", "mutation_scale": 18, "connectionstyle": "arc3,rad=0.15"},
+    "suggested": {"linewidth": 3.0, "color": "#b366ff", "mutation_scale": 15, "linestyle": "dashed",
+                  "alpha": 0.85},
+}
+
+LABEL_STYLE = {
+    "fontsize": 11,
+    "fontweight": "bold",
+    "color": "white",
+    "family": "Arial",
+    "horizontalalignment": "center",
+    "verticalalignment": "center",
+    "bbox": {"boxstyle": "round,pad=0.3", "fc": "#333333", "ec": "#555555", "alpha": 0.8},
+}
+
+class GraphView:
+    def __init__(self, figure, canvas, bg_color):
+        self.figure = figure
+        self.canvas = canvas
+        figure.clear()
+        figure.patch.set_facecolor(bg_color)
+        self.ax = figure.add_subplot(111)
+        self.ax.set_facecolor(bg_color)
+        self.ax.axis('off')
+        # A placeholder title so tight_layout leaves room for the real one
+        self.ax.set_title("Word Ladder", fontsize=15, fontweight="bold", color="white", pad=12)
+
+        self.edges = LineCollection([], linewidths=1.7, colors=[to_rgba("#888888", 0.8)], zorder=1,
+                                    animated=True)
+        self.ax.add_collection(self.edges)
+        self.nodes = self.ax.scatter([], [], zorder=2, animated=True)
+        self.arrows = {}  # (kind, word, next word) -> FancyArrowPatch
+        self.labels = {}  # word -> Text
+        self.legend_key = None
+        self.background = None
+        self.full_redraws = 0
+        self.blits = 0
+
+        self.ax.set_xlim(-1, 1)
+        self.ax.set_ylim(-1, 1)
+        figure.tight_layout()
+        self._draw_id = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def close(self):
+        """Stop listening to the canvas; the figure is about to be cleared"""
+        self.canvas.mpl_disconnect(self._draw_id)
+
+    def update(self, scene):
+        """Show a scene from compute_graph_scene, blitting when the background is unchanged"""
+        start, target, path = scene["start"], scene["target"], scene["path"]
+        subgraph, pos = scene["subgraph"], scene["pos"]
+        has_path = bool(path and len(path) > 1)
+        suggested_path = scene["suggested_path"] if scene["show_suggested_path"] else None
+        has_suggested = bool(suggested_path)
+
+        path_nodes = set(path) if has_path else set()
+        def role(word):
+            if word == start:
+                return "start"
+            if word == target:
+                return "target"
+            return "path" if word in path_nodes else "other"
+
+        words = sorted(subgraph.nodes(), key=lambda word: ROLE_ORDER.index(role(word)))
+        styles = [NODE_STYLES[role(word)] for word in words]
+        sizes = {word: style[0] for word, style in zip(words, styles)}
+        self.nodes.set_offsets(np.array([pos[word] for word in words], dtype=float).reshape(-1, 2))
+        self.nodes.set_sizes([style[0] for style in styles])
+        self.nodes.set_facecolors([to_rgba(style[1], style[4]) for style in styles])
+        self.nodes.set_edgecolors([to_rgba(style[2], style[4]) for style in styles])
+        self.nodes.set_linewidths([style[3] for style in styles])
+
+        self.edges.set_segments([(pos[u], pos[v]) for u, v in subgraph.edges()])
+
+        wanted = []
+        if has_path:
+            wanted.extend(("path", u, v) for u, v in zip(path, path[1:]))
+        if has_suggested and len(suggested_path) > 1:
+            wanted.extend(("suggested", u, v) for u, v in zip(suggested_path, suggested_path[1:]))
+        self._sync_arrows(wanted, pos, sizes)
+        self._sync_labels(words, pos)
+
+        background_changed = self._set_limits(pos)
+        background_changed |= self._set_legend(has_path, has_suggested)
+        background_changed |= self._set_title(f"Word Ladder: {scene['title_start']} → {target}")
+
+        if background_changed or self.background is None:
+            # Redraws the background; _on_draw then captures it and draws the graph on top
+            self.canvas.draw()
+            self.full_redraws += 1
+        else:
+            self.canvas.restore_region(self.background)
+            self._draw_animated()
+            self.canvas.blit(self.figure.bbox)
+            self.blits += 1
+
+    def _sync_arrows(self, wanted, pos, sizes):
+        for key in list(self.arrows):
+            if key not in wanted:
+                self.arrows.pop(key).remove()
+        for key in wanted:
+            kind, u, v = key
+            if u not in pos or v not in pos:
+                continue
+            arrow = self.arrows.get(key)
+            if arrow is None:
+                arrow = FancyArrowPatch(pos[u], pos[v], arrowstyle="-|>", zorder=1, animated=True,
+                                        **ARROW_STYLES[kind])
+                self.ax.add_patch(arrow)
+                self.arrows[key] = arrow
+            else:
+                arrow.set_positions(pos[u], pos[v])
+            # Stop the arrow at the node borders, as networkx does
+            arrow.shrinkA = math.sqrt(sizes.get(u, 0)) / 2
+            arrow.shrinkB = math.sqrt(sizes.get(v, 0)) / 2
+            arrow.stale = True
+
+    def _sync_labels(self, words, pos):
+        for word in list(self.labels):
+            if word not in pos:
+                self.labels.pop(word).remove()
+        for word in words:
+            label = self.labels.get(word)
+            if label is None:
+                self.labels[word] = self.ax.text(*pos[word], word, zorder=3, animated=True, **LABEL_STYLE)
+            else:
+                label.set_position(pos[word])
+
+    def _set_limits(self, pos):
+        """Fit the axes around the nodes; returns True if the limits had to change"""
+        if not pos:
+            return False
+        xs = [p[0] for p in pos.values()]
+        ys = [p[1] for p in pos.values()]
+        # Room for the node circles and labels, which are sized in points
+        x_pad = 0.2 * (max(xs) - min(xs)) + 0.15
+        y_pad = 0.2 * (max(ys) - min(ys)) + 0.15
+        left, right, bottom, top = min(xs) - x_pad, max(xs) + x_pad, min(ys) - y_pad, max(ys) + y_pad
+
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        fits = x0 <= left and right <= x1 and y0 <= bottom and top <= y1
+        # Keep the current limits while the nodes fit and still fill most of the view
+        if fits and (right - left) >= 0.6 * (x1 - x0) and (top - bottom) >= 0.6 * (y1 - y0):
+            return False
+        self.ax.set_xlim(left, right)
+        self.ax.set_ylim(bottom, top)
+        return True
+
+    def _set_legend(self, has_path, has_suggested):
+        """Rebuild the legend only when its entries change"""
+        key = (has_path, has_suggested)
+        if key == self.legend_key:
+            return False
+        self.legend_key = key
+
+        legend_elements = [
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#2ecc71", markeredgecolor="#87f5b3",
+                       markersize=15, markeredgewidth=2, label='Start Word'),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#e74c3c", markeredgecolor="#ff8b81",
+                       markersize=15, markeredgewidth=2, label='Target Word'),
+        ]
+        if has_path:
+            legend_elements.extend([
+                plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#3584e4", markeredgecolor="#66a5ff",
+                           markersize=15, markeredgewidth=2, label='Path Words'),
+                plt.Line2D([0], [0], color="#ffaa33", lw=4, label='Current Path')
+            ])
+        if has_suggested:
+            legend_elements.append(
+                plt.Line2D([0], [0], color="#b366ff", lw=3, dashes=(5, 2), label='Suggested Path')
+            )
+        legend_elements.append(
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#555555", markeredgecolor="#777777",
+                       markersize=15, markeredgewidth=2, label='Other Words')
+        )
+
+        legend = self.ax.legend(handles=legend_elements, loc='lower right', fontsize=10, frameon=True,
+                                framealpha=0.9, facecolor='#222222', edgecolor='#555555',
+                                title="Legend", title_fontsize=12)
+        legend.get_title().set_color('#ffcc00')
+        for text in legend.get_texts():
+            text.set_color('white')
+        return True
+
+    def _set_title(self, title):
+        if self.ax.get_title() == title:
+            return False
+        self.ax.set_title(title, fontsize=15, fontweight="bold", color="white", pad=12)
+        return True
+
+    def _on_draw(self, event):
+        """After a full draw: save the background and put the graph back on top of it"""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.edges)
+        for arrow in self.arrows.values():
+            self.ax.draw_artist(arrow)
+        self.ax.draw_artist(self.nodes)
+        for label in self.labels.values():
+            self.ax.draw_artist(label)
+
+    def stats(self):
+        return {"full_redraws": self.full_redraws, "blits": self.blits}
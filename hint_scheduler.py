@@ -0,0 +1,83 @@
+"""
+Runs hint searches off the UI thread, at most one at a time.
+
+Each request carries a key (the game uses (current word, target word)).
+Asking for a different key cancels the search that is still running, so
+rapid clicking never stacks up searches competing for the GIL. Asking for
+the key that is already being searched joins that search instead of
+starting another one; only the most recent callback is called. Results of
+cancelled or superseded searches are dropped.
+"""
+import threading
+from word_graph import CancellationToken
+
+class HintRequest:
+    """One scheduled search: its key, cancellation token and the callback to answer"""
+    def __init__(self, key, token, callback):
+        self.key = key
+        self.token = token
+        self.callback = callback
+
+class HintScheduler:
+    """
+    job(cancel) runs in a worker thread and returns the path (or None); pass
+    cancel on to the solver so it can give up early. callback(path, error)
+    is handed to dispatch, e.g. lambda f: root.after(0, f) to run it on the
+    Tk thread; by default it is called directly from the worker.
+    """
+    def __init__(self, dispatch=None, max_time=5.0):
+        self.dispatch = dispatch if dispatch is not None else (lambda function: function())
+        self.max_time = max_time
+        self._active = None
+        self._lock = threading.Lock()
+        self.started = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    def submit(self, key, job, callback):
+        """Schedule job for key, cancelling whatever else is running. Returns the HintRequest."""
+        with self._lock:
+            active = self._active
+            if active is not None and active.key == key and not active.token.cancelled:
+                # Same question already being answered: answer this caller instead
+                active.callback = callback
+                self.coalesced += 1
+                return active
+
+            if active is not None:
+                active.token.cancel()
+                self.cancelled += 1
+
+            request = HintRequest(key, CancellationToken.after(self.max_time), callback)
+            self._active = request
+            self.started += 1
+
+        threading.Thread(target=self._run, args=(request, job), daemon=True).start()
+        return request
+
+    def cancel(self):
+        """Cancel the running search (if any) without calling its callback, e.g. after a move"""
+        with self._lock:
+            if self._active is not None:
+                self._active.token.cancel()
+                self._active = None
+                self.cancelled += 1
+
+    def _run(self, request, job):
+        try:
+            path, error = job(request.token), None
+        except Exception as e:
+            path, error = None, e
+        self.dispatch(lambda: self._deliver(request, path, error))
+
+    def _deliver(self, request, path, error):
+        # Checked again here, since a cancel() may have happened while the result was dispatched
+        with self._lock:
+            if self._active is not request:
+                return
+            self._active = None
+            callback = request.callback
+        callback(path, error)
+
+    def stats(self):
+        return {"started": self.started, "coalesced": self.coalesced, "cancelled": self.cancelled}
@@ -0,0 +1,354 @@
+"""
+Headless word ladder backend: a small asyncio HTTP server speaking JSON.
+
+    python hint_server.py --port 8080 --processes 4
+
+    GET /solve?start=cold&target=warm&algorithm=astar
+    GET /hint?current=cold&target=warm
+    GET /validate?current=cold&next=cord&target=warm&banned_letters=q,x,z
+    GET /stats
+
+POST requests with a JSON object body take the same fields as the query
+string. Searches are CPU-bound, so they never run on the event loop: /solve
+goes to a process pool (or a thread pool with --processes 0) and distance
+tables for /hint are built in a thread pool and kept in a bounded LRU cache.
+Identical requests that arrive while one is already being computed share
+its result. When more than --max-pending computations are queued the
+server answers 503 with Retry-After instead of queueing without bound.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qsl
+import wordladder
+from word_loader import load_dictionary
+from word_graph import (DistanceOracle, get_neighbor_index, validate_step, SearchConstraints, MOVE_OK,
+                        MOVE_MESSAGES, bfs_shortest_path)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+MAX_BODY = 64 * 1024
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class OracleCache:
+    """
+    Bounded LRU of DistanceOracles keyed by target word; safe to use from executor threads.
+    Requests for a target whose table is still being built wait for that build
+    instead of starting another one. Tables cut short by max_time are handed
+    to the requests waiting for them but not cached.
+    """
+    def __init__(self, word_list, max_entries=256, max_time=5.0):
+        self.word_list = word_list
+        self.max_entries = max_entries
+        self.max_time = max_time
+        self._oracles = OrderedDict()
+        self._building = {}  # target -> Future for a table being built
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+        self.incomplete = 0
+
+    def get(self, target):
+        with self._lock:
+            oracle = self._oracles.get(target)
+            if oracle is not None:
+                self._oracles.move_to_end(target)
+                self.hits += 1
+                return oracle
+            future = self._building.get(target)
+            building = future is None
+            if building:
+                self.misses += 1
+                future = concurrent.futures.Future()
+                self._building[target] = future
+            else:
+                self.joined += 1
+        if not building:
+            return future.result()  # Another thread is already building this table
+        return self._build(target, future)
+
+    def _build(self, target, future):
+        try:
+            oracle = DistanceOracle(target, self.word_list, self.max_time)
+        except BaseException as e:
+            with self._lock:
+                del self._building[target]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._building[target]
+            if oracle.complete:
+                self._oracles[target] = oracle
+                self._oracles.move_to_end(target)
+                while len(self._oracles) > self.max_entries:
+                    self._oracles.popitem(last=False)
+            else:
+                self.incomplete += 1
+        future.set_result(oracle)
+        return oracle
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._oracles), "building": len(self._building), "hits": self.hits,
+                    "misses": self.misses, "joined": self.joined, "incomplete": self.incomplete}
+
+def hint_for(current, target, oracles):
+    """Next move from current towards target, read from the target's distance table"""
+    result = {"current": current, "target": target, "hint": None, "distance": None, "error": None}
+    if len(current) != len(target):
+        result["error"] = "Words must be of the same length"
+        return result
+    if current not in oracles.word_list or target not in oracles.word_list:
+        result["error"] = "Word not in dictionary"
+        return result
+
+    oracle = oracles.get(target)
+    result["distance"] = oracle.distance(current)
+    if result["distance"] is None and not oracle.complete:
+        # The table was cut short before reaching current; solve this position directly
+        path = bfs_shortest_path(current, target, oracles.word_list, max_time=oracles.max_time)
+        if path:
+            result["distance"] = len(path) - 1
+            result["hint"] = path[1] if len(path) > 1 else None
+            return result
+    if result["distance"] is None:
+        result["error"] = "No valid path found"
+    else:
+        result["hint"] = oracle.next_move(current)
+    return result
+
+def validate_move(current, next_word, word_list, constraints=None, target=None):
+    """Check a single move; cheap enough to answer on the event loop"""
+    reason = validate_step(current, next_word, word_list, constraints, target)
+    return {"valid": reason == MOVE_OK, "reason": reason, "message": MOVE_MESSAGES[reason]}
+
+class HintServer:
+    def __init__(self, word_list, processes=0, threads=None, max_pending=64, max_time=5.0,
+                 oracle_cache_size=256):
+        self.word_list = word_list
+        self.max_time = max_time
+        self.oracles = OracleCache(word_list, oracle_cache_size, max_time)
+        self.threads = concurrent.futures.ThreadPoolExecutor(threads)
+        self.processes = None
+        if processes:
+            self.processes = wordladder.make_solver_pool(word_list, processes, max_time)
+        self.max_pending = max_pending
+        self.pending = 0
+        self.in_flight = {}  # key -> Future shared by identical concurrent requests
+        self.requests = 0
+        self.deduplicated = 0
+        self.rejected = 0
+
+    def close(self):
+        self.threads.shutdown(wait=False)
+        if self.processes is not None:
+            self.processes.shutdown(wait=False)
+
+    async def compute(self, key, executor, function, *args):
+        """Run function(*args) in executor, sharing the result with identical in-flight requests"""
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(future)
+
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HttpError(503, "Server busy, try again shortly")
+
+        self.pending += 1
+        future = asyncio.get_running_loop().run_in_executor(executor, function, *args)
+        self.in_flight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self.pending -= 1
+            self.in_flight.pop(key, None)
+
+    async def solve(self, params):
+        start, target = word_param(params, "start"), word_param(params, "target")
+        algorithm = params.get("algorithm", "bfs")
+        if algorithm not in wordladder.SOLVERS:
+            raise HttpError(400, f"Unknown algorithm '{algorithm}' (choose from {', '.join(sorted(wordladder.SOLVERS))})")
+        key = ("solve", start, target, algorithm)
+        if self.processes is not None:
+            return await self.compute(key, self.processes, wordladder.solve_in_worker,
+                                      start, target, algorithm, self.max_time)
+        return await self.compute(key, self.threads, wordladder.solve_pair,
+                                  start, target, self.word_list, algorithm, self.max_time)
+
+    async def hint(self, params):
+        current, target = word_param(params, "current"), word_param(params, "target")
+        return await self.compute(("hint", current, target), self.threads,
+                                  hint_for, current, target, self.oracles)
+
+    async def validate(self, params):
+        current, next_word = word_param(params, "current"), word_param(params, "next")
+        constraints = None
+        if params.get("banned_letters") or params.get("banned_words"):
+            constraints = SearchConstraints(list_param(params, "banned_letters"), list_param(params, "banned_words"))
+        # The final move onto the target is allowed even if the target breaks the bans
+        target = word_param(params, "target") if params.get("target") else None
+        result = validate_move(current, next_word, self.word_list, constraints, target)
+        result.update(current=current, next=next_word, target=target)
+        return result
+
+    async def stats(self, params):
+        return {"requests": self.requests, "pending": self.pending, "in_flight": len(self.in_flight),
+                "deduplicated": self.deduplicated, "rejected": self.rejected,
+                "oracle_cache": self.oracles.stats()}
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        routes = {"/solve": self.solve, "/hint": self.hint, "/validate": self.validate, "/stats": self.stats}
+        handler = routes.get(url.path)
+        if handler is None:
+            raise HttpError(404, f"No such endpoint: {url.path}")
+
+        params = dict(parse_qsl(url.query))
+        if method == "POST":
+            if body:
+                try:
+                    data = json.loads(body)
+                except ValueError:
+                    raise HttpError(400, "Request body must be JSON")
+                if not isinstance(data, dict):
+                    raise HttpError(400, "Request body must be a JSON object")
+                params.update(data)
+        elif method != "GET":
+            raise HttpError(405, f"Method {method} not allowed")
+        return await handler(params)
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection, keeping it open for HTTP/1.1 clients"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self.respond(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self.respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, {"error": "Request body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                try:
+                    status, payload = 200, await self.dispatch(method.upper(), target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": e.message}
+                except Exception as e:
+                    status, payload = 500, {"error": str(e)}
+                await self.respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode("utf-8")
+        headers = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                   "Content-Type: application/json",
+                   f"Content-Length: {len(body)}",
+                   f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if status == 503:
+            headers.append("Retry-After: 1")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+def word_param(params, name):
+    value = params.get(name)
+    if not isinstance(value, str) or not value.strip():
+        raise HttpError(400, f"Missing '{name}'")
+    return value.strip().lower()
+
+def list_param(params, name):
+    """A list of words or letters, given as a JSON list or a comma-separated string"""
+    value = params.get(name) or []
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        raise HttpError(400, f"'{name}' must be a list or a comma-separated string")
+    return [str(item).strip().lower() for item in value if str(item).strip()]
+
+async def serve(host, port, word_list, **options):
+    server = HintServer(word_list, **options)
+    listener = await asyncio.start_server(server.handle_connection, host, port)
+    print(f"Serving word ladder API on http://{host}:{port}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve word ladder hints over HTTP/JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Worker processes for /solve (0 runs searches in the thread pool)")
+    parser.add_argument("--threads", type=int, default=None, help="Threads for hint tables and threaded solves")
+    parser.add_argument("--max-pending", type=int, default=64,
+                        help="Queued computations before requests are refused with 503")
+    parser.add_argument("--max-time", type=float, default=5.0, help="Time limit per search in seconds")
+    parser.add_argument("--oracle-cache", type=int, default=256, help="Distance tables kept in memory")
+    args = parser.parse_args(argv)
+
+    word_list = load_dictionary()
+    start_time = time.time()
+    # Decode every length's words before workers fork; the graph itself is mapped and shared
+    index = get_neighbor_index(word_list)
+    for length in word_list.lengths():
+        index.prepare(length)
+    print(f"Word buckets ready in {time.time() - start_time:.2f}s")
+
+    try:
+        asyncio.run(serve(args.host, args.port, word_list, processes=args.processes, threads=args.threads,
+                          max_pending=args.max_pending, max_time=args.max_time,
+                          oracle_cache_size=args.oracle_cache))
+    except KeyboardInterrupt:
+        print("Server stopped.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
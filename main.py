@@ -1,8 +1,8 @@
-from word_loader import load_words_from_pickle
-from word_graph import is_valid_transformation, bfs_shortest_path, a_star_search, ucs_shortest_path
+from word_loader import load_dictionary
+from word_graph import validate_step, MOVE_OK, MOVE_NOT_IN_DICTIONARY, bfs_shortest_path, a_star_search, ucs_shortest_path, DistanceOracle
 
-# Load words from the filtered word list
-word_list = load_words_from_pickle()
+# Load words from the filtered word list, partitioned by length once
+word_list = load_dictionary()
 
 def play_game_with_ai():
     """
@@ -23,9 +23,18 @@ def play_game_with_ai():
 
     print(f"\nStarting game: Transform '{start}' → '{target}'")
 
+    # The target is fixed for the whole game, so one BFS from it answers every hint
+    oracle = DistanceOracle(target, word_list)
+
     current_word = start
     moves = 0
 
+    def hint_path(solver):
+        """Read the path from the distance table, solving only if the table was cut short"""
+        if oracle.complete or oracle.distance(current_word) is not None:
+            return oracle.path_from(current_word)
+        return solver(current_word, target, word_list)
+
     while current_word != target:
         print(f"\nCurrent word: {current_word}")
         next_word = input("Enter next word (or type 'hint' for BFS, 'astar' for A*, 'ucs' for UCS, 'exit' to quit): ").strip().lower()
@@ -35,7 +44,7 @@ def play_game_with_ai():
             return
         
         if next_word == "hint":
-            ai_path = bfs_shortest_path(current_word, target, word_list)
+            ai_path = hint_path(bfs_shortest_path)
             if ai_path:
                 print(f"Hint (BFS): Next suggested move is '{ai_path[1]}'")
             else:
@@ -43,7 +52,7 @@ def play_game_with_ai():
             continue
 
         if next_word == "astar":
-            ai_path = a_star_search(current_word, target, word_list)
+            ai_path = hint_path(a_star_search)
             if ai_path:
                 print(f"Hint (A*): Next suggested move is '{ai_path[1]}'")
             else:
@@ -51,7 +60,7 @@ def play_game_with_ai():
             continue
 
         if next_word == "ucs":
-            ai_path = ucs_shortest_path(current_word, target, word_list)
+            ai_path = hint_path(ucs_shortest_path)
             if ai_path:
                 print(f"Hint (UCS): Next suggested move is '{ai_path[1]}'")
             else:
@@ -59,11 +68,12 @@ def play_game_with_ai():
             continue
 
         # Validate the move
-        if next_word not in word_list:
+        reason = validate_step(current_word, next_word, word_list)
+        if reason == MOVE_NOT_IN_DICTIONARY:
             print("Invalid word! Not in dictionary.")
             continue
 
-        if not is_valid_transformation(current_word, next_word):
+        if reason != MOVE_OK:
             print("Invalid move! Words must differ by exactly one letter.")
             continue
 
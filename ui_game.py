@@ -5,18 +5,20 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
-import time
-from word_loader import load_words_from_pickle, get_words_by_length
-from word_graph import bfs_shortest_path, a_star_search, ucs_shortest_path, get_valid_transformations, is_valid_transformation, get_word_neighbors, optimized_bfs
+from concurrent.futures import ThreadPoolExecutor
+from word_loader import load_dictionary, get_words_by_length
+from word_graph import bfs_shortest_path, a_star_search, ucs_shortest_path, get_valid_transformations, get_word_neighbors, optimized_bfs, same_component, DistanceOracle, validate_step, SearchConstraints, MOVE_OK, MOVE_BANNED_WORD, MOVE_BANNED_LETTER, MOVE_MESSAGES, run_algorithm_comparison
+from hint_scheduler import HintScheduler
+from graph_layout import LayoutCache, layered_exploration
+from graph_view import GraphView
 import random
 from PIL import Image, ImageTk
 import os
 from matplotlib.animation import FuncAnimation
-import heapq
-from collections import deque
 
-# Load words
-word_list = load_words_from_pickle()
+# Load words (partitioned by length once; games search a frozen per-length view)
+dictionary = load_dictionary()
+word_list = dictionary
 word_graph = nx.Graph()
 
 # Setup Main Game Window
@@ -35,9 +37,14 @@ game_mode = tk.StringVar(value="Beginner")
 moves = 0
 banned_letters = []
 banned_words = []
+move_constraints = None  # SearchConstraints for Challenge mode, None otherwise
 graph_canvas = None
 current_figure = None
 word_path = []  # Initialize this with the game variables
+hint_oracle = None  # Distance table to the current target, built in the background per game
+loading_popup = None
+# Hint searches run one at a time off the Tk thread; answers come back through root.after
+hint_scheduler = HintScheduler(dispatch=lambda callback: root.after(0, callback))
 
 # Game Modes with improved word pair selections
 GAME_MODES = {
@@ -89,6 +96,16 @@ DARK_THEME = {
 
 current_animation = None
 
+# Embedded graph renders: the subgraph and layout are computed on one
+# background thread, drawn on the Tk thread, and dropped if a newer render
+# was requested in the meantime
+graph_executor = ThreadPoolExecutor(max_workers=1)
+graph_generation = 0
+# Node positions per game session, so each move only places the new words;
+# the built-in puzzles keep their layouts for when they come round again
+graph_view = None  # Persistent artists of the embedded graph, created on first draw
+layout_cache = LayoutCache(pinned_pairs=[pair for pairs in GAME_MODES.values() for pair in pairs])
+
 # First, add variables to track the current word pair index for each mode
 current_pair_indices = {
     "Beginner": 0,
@@ -151,6 +168,7 @@ def apply_theme_to_elements():
 def start_game():
     global moves, word_path, word_list
     moves = 0
+    hint_scheduler.cancel()  # A hint for the previous game is no longer wanted
 
     # Get the current mode
     mode = game_mode.get()
@@ -180,10 +198,14 @@ def start_game():
     
     # Apply and display challenge constraints
     apply_challenge_constraints()
-    
+
     # Show the initial graph with start and target words
     update_embedded_graph(start, target)
 
+    # One BFS from the target makes every later hint in this game a table lookup;
+    # in Challenge mode it never steps on banned letters or words
+    build_hint_oracle(target)
+
     # Customize message based on game mode
     if mode == "Beginner":
         message = f"Transform '{start}' to '{target}' by changing one letter at a time.\nThis is a simple beginner challenge!"
@@ -198,31 +220,45 @@ def start_game():
     # Hide loading screen
     hide_loading_screen()
 
+def build_hint_oracle(target):
+    """
+    Build the distance table for a new game on the background thread.
+    Hints fall back to a search until it is ready, and a table finished
+    after the game has changed is thrown away.
+    """
+    global hint_oracle
+    hint_oracle = None
+    words = word_list
+    constraints = move_constraints
+
+    def build():
+        try:
+            oracle = DistanceOracle(target, words, constraints=constraints)
+        except Exception as e:
+            print(f"Hint table error: {e}")
+            return
+        root.after(0, lambda: install(oracle))
+
+    def install(oracle):
+        # Runs on the Tk thread via root.after
+        global hint_oracle
+        if target_word.get() == target and word_list is words and move_constraints is constraints:
+            hint_oracle = oracle
+
+    graph_executor.submit(build)
+
 def validate_move():
     global moves, word_path
     next_word = entry_word.get().strip().lower()
     entry_word.delete(0, 'end')  # Clear the entry after submission
 
-    if len(next_word) != len(current_word.get()):
-        show_popup("Invalid Move!", "Words must be of the same length.")
-        return
-
-    if next_word not in word_list:
-        show_popup("Invalid Move!", "This word is not in the dictionary.")
+    reason = validate_step(current_word.get(), next_word, word_list, move_constraints, target_word.get())
+    if reason != MOVE_OK:
+        show_popup("Invalid Move!", invalid_move_message(reason, next_word))
         return
 
-    if sum(1 for a, b in zip(current_word.get(), next_word) if a != b) != 1:
-        show_popup("Invalid Move!", "Words must differ by only one letter.")
-        return
-
-    if game_mode.get() == "Challenge":
-        if next_word in banned_words:
-            show_popup("Invalid Move!", f"The word '{next_word}' is banned in this challenge.")
-            return
-        
-        if any(letter in banned_letters for letter in next_word):
-            show_popup("Invalid Move!", f"You cannot use the banned letters: {', '.join(banned_letters)}")
-            return
+    # Any hint still being searched was for the previous word
+    hint_scheduler.cancel()
 
     # Add the new word to our path
     word_path.append(next_word)
@@ -244,55 +280,108 @@ def validate_move():
         # Only show popup but don't auto-start a new game
         show_game_completed_popup(f"🎉 Congratulations! You won in {moves} moves!")
 
+def invalid_move_message(reason, next_word):
+    """Explain a validate_step reason code to the player"""
+    if reason == MOVE_BANNED_WORD:
+        return f"The word '{next_word}' is banned in this challenge."
+    if reason == MOVE_BANNED_LETTER:
+        return f"You cannot use the banned letters: {', '.join(banned_letters)}"
+    return MOVE_MESSAGES[reason]
+
 def get_hint(algorithm):
     """Get a hint for the next move using the specified algorithm"""
-    show_loading_screen("Finding Best Move...")
-    
-    def fetch_hint():
-        try:
-            time.sleep(1)  
-            start = current_word.get()
-            target = target_word.get()
-
-            if algorithm == "BFS":
-                path = bfs_shortest_path(start, target, word_list)
-            elif algorithm == "A*":
-                path = a_star_search(start, target, word_list)
-            elif algorithm == "UCS":
-                path = ucs_shortest_path(start, target, word_list)
-            else:
-                path = None
-
-            hide_loading_screen()
+    start = current_word.get()
+    target = target_word.get()
+    oracle = hint_oracle
+    search_words = word_list
+    constraints = move_constraints
+    solver = {"BFS": bfs_shortest_path, "A*": a_star_search, "UCS": ucs_shortest_path}.get(algorithm)
+
+    def fetch_hint(cancel):
+        # Runs in the scheduler's worker thread: no Tk calls here
+        if (oracle is not None and oracle.target == target and oracle.word_list is search_words
+                and oracle.constraints is constraints
+                and (oracle.complete or oracle.distance(start) is not None)):
+            # All three algorithms return shortest ladders, which the
+            # game's distance table already knows
+            return oracle.path_from(start)
+        if solver is None:
+            return None
+        # Challenge rules apply to the AI too
+        return solver(start, target, search_words, cancel=cancel, constraints=constraints)
+
+    def show_hint(path, error):
+        # Runs on the Tk thread via root.after
+        hide_loading_screen()
+        if error is not None:
+            show_popup("Error", f"An error occurred: {str(error)}")
+        elif path and len(path) > 1:
+            hint_word = path[1]
+            show_popup("AI Hint", f"🔍 Next best move ({algorithm}): {hint_word}")
+            hint_label.configure(text=f"Last Hint: {hint_word} (via {algorithm})")
+            safe_update_embedded_graph(start, target, path)
+        else:
+            show_popup("Hint Failed", "No valid path found!")
 
-            if path and len(path) > 1:
-                hint_word = path[1]
-                show_popup("AI Hint", f"🔍 Next best move ({algorithm}): {hint_word}")
-                hint_label.configure(text=f"Last Hint: {hint_word} (via {algorithm})")
-                safe_update_embedded_graph(start, target, path)
-            else:
-                show_popup("Hint Failed", "No valid path found!")
-        except Exception as e:
-            hide_loading_screen()
-            show_popup("Error", f"An error occurred: {str(e)}")
-    
-    threading.Thread(target=fetch_hint).start()
+    show_loading_screen("Finding Best Move...")
+    # Repeated clicks for the same position join the running search; any
+    # other request cancels it
+    hint_scheduler.submit((start, target), fetch_hint, show_hint)
     game_stats["hints_used"][algorithm] += 1
 
 
 def update_embedded_graph(start, target, path=None, animated=False):
-    """Update the graph visualization with animation support"""
-    global current_figure, current_animation
-    
+    """
+    Request a redraw of the graph visualization. Returns immediately: the
+    subgraph and its layout are computed in the background and drawn via
+    root.after, and any render that a newer request supersedes is dropped.
+    """
+    global graph_generation
+    graph_generation += 1
+    generation = graph_generation
+
     # Use the word_path by default if no specific path is provided
     if path is None and len(word_path) > 0:
         path = word_path
-        
+    # Snapshot everything the worker needs; the globals keep changing on this thread
+    path = list(path) if path else None
+    title_start = word_path[0] if len(word_path) > 0 else start
+    words = word_list
+
+    def compute():
+        if generation != graph_generation:
+            return  # Superseded before it started
+        try:
+            scene = compute_graph_scene(start, target, path, words, layout_key=(title_start, target))
+        except Exception as e:
+            print(f"Graph update error: {e}")
+            return
+        scene["title_start"] = title_start
+        root.after(0, lambda: draw_if_current(scene, generation))
+
+    graph_executor.submit(compute)
+
+def draw_if_current(scene, generation):
+    """Draw a computed scene unless a newer render has been requested since"""
+    if generation != graph_generation:
+        return
+    try:
+        draw_embedded_graph(scene)
+    except Exception as e:
+        print(f"Graph draw error: {e}")
+
+def compute_graph_scene(start, target, path, words, layout_key=None):
+    """
+    Build the subgraph and layout to display. Runs on the graph worker
+    thread, so it must not touch Tk or matplotlib. With a layout_key (the
+    game's start and target) the layout extends the previous one for that
+    game instead of being recomputed from scratch.
+    """
     # If we only have one word in the path and it's not already at the target,
     # calculate a suggested path from start to target to show possibilities
     if (path is None or len(path) <= 1) and start != target:
         # Try to find a path using BFS
-        suggested_path = bfs_shortest_path(start, target, word_list)
+        suggested_path = bfs_shortest_path(start, target, words)
         if suggested_path:
             # If we found a path, show it as a dotted/faded suggestion
             show_suggested_path = True
@@ -301,18 +390,7 @@ def update_embedded_graph(start, target, path=None, animated=False):
     else:
         show_suggested_path = False
         suggested_path = None
-    
-    # Stop any existing animation
-    if current_animation:
-        current_animation.event_source.stop()
-        current_animation = None
-    
-    # Clear previous figure if it exists
-    if current_figure is not None:
-        current_figure.clear()
-    else:
-        current_figure = plt.figure(figsize=(4, 3.5), dpi=100)  # Reduced size from (6, 5)
-    
+
     # Create a subgraph of relevant words
     relevant_words = set()
     if path:
@@ -333,7 +411,7 @@ def update_embedded_graph(start, target, path=None, animated=False):
     
     # Add neighboring words for context
     for word in words_to_process:
-        neighbors = get_valid_transformations(word, word_list)
+        neighbors = get_valid_transformations(word, words)
         # Limit to 2 neighbors to keep graph readable
         for neighbor in list(neighbors)[:2]:
             relevant_words.add(neighbor)
@@ -343,173 +421,43 @@ def update_embedded_graph(start, target, path=None, animated=False):
     for word in relevant_words:
         subgraph.add_node(word)
         
-    # Add edges
+    # Add edges from the cached neighbor sets instead of comparing every pair
     for word in relevant_words:
-        for neighbor in relevant_words:
-            if word != neighbor and is_valid_transformation(word, neighbor):
+        for neighbor in get_word_neighbors(word, words):
+            if neighbor in relevant_words:
                 subgraph.add_edge(word, neighbor)
-    
-    ax = current_figure.add_subplot(111)
-    pos = nx.spring_layout(subgraph, seed=42)  # Fixed seed for consistent layout
-    
-    # Set figure background color to match theme
-    bg_color = DARK_THEME["bg_color"]  # Use the theme's background color
-    ax.set_facecolor(bg_color)
-    current_figure.patch.set_facecolor(bg_color)
-    
-    # Create node groups for legend
-    regular_nodes = set(subgraph.nodes()) - {start, target}
-    if path and len(path) > 1:
-        path_nodes = set(path) - {start, target}  # Remove start/target to avoid double-coloring
-        regular_nodes -= path_nodes  # Remove path nodes from regular nodes
+
+    if layout_key is not None:
+        pos = layout_cache.layout(subgraph, layout_key)
     else:
-        path_nodes = set()
-    
-    # Draw background nodes (regular nodes) with 3D-like effect
-    nx.draw_networkx_nodes(subgraph, pos, ax=ax, 
-                        nodelist=list(regular_nodes), 
-                        node_size=650,  # Increased size
-                        node_color="#555555",  # Darker gray but still visible
-                        alpha=0.8,
-                        edgecolors="#777777",  # Lighter border for 3D effect
-                        linewidths=2)  # Thicker border
-    
-    # Draw regular edges with better visibility
-    nx.draw_networkx_edges(subgraph, pos, ax=ax, 
-                        width=1.7,  # Thicker lines
-                        edge_color="#888888",  # Lighter color for visibility
-                        alpha=0.8,  # More opacity
-                        style='solid')  # Solid lines
-    
-    # Highlight the user's path with more vivid colors if it exists
-    if path and len(path) > 1:
-        path_edges = list(zip(path, path[1:]))
-        
-        # Draw path nodes with larger size, glow effect
-        nx.draw_networkx_nodes(subgraph, pos, ax=ax, 
-                            nodelist=list(path_nodes), 
-                            node_size=750,  # Even bigger
-                            node_color="#3584e4",  # Bright blue 
-                            edgecolors="#66a5ff",  # Lighter blue border for glow effect
-                            linewidths=2.5,
-                            alpha=1.0)
-        
-        # Draw path edges with animated arrow and brighter color
-        nx.draw_networkx_edges(subgraph, pos, ax=ax, 
-                            edgelist=path_edges, 
-                            width=4.0,  # Thicker than before
-                            edge_color="#ffaa33",  # Brighter orange for better visibility
-                            arrows=True,
-                            arrowsize=18,  # Larger arrows
-                            connectionstyle="arc3,rad=0.15")  # More curved for better visibility
-    
-    # If appropriate, show a suggested path with dotted lines
-    if show_suggested_path and suggested_path and len(suggested_path) > 1:
-        suggested_edges = list(zip(suggested_path, suggested_path[1:]))
-        nx.draw_networkx_edges(subgraph, pos, ax=ax, 
-                            edgelist=suggested_edges, 
-                            width=3.0,  # Thicker
-                            edge_color="#b366ff",  # Brighter purple
-                            style='dashed',
-                            alpha=0.85,  # More visible
-                            arrows=True,
-                            arrowsize=15)  # Larger arrows
-    
-    # Highlight start word with distinct color, largest size, and glow effect
-    nx.draw_networkx_nodes(subgraph, pos, ax=ax, 
-                        nodelist=[start], 
-                        node_size=950,  # Largest size
-                        node_color="#2ecc71",  # Brighter green
-                        edgecolors="#87f5b3",  # Light green for glow effect
-                        linewidths=3.0)  # Thicker border
-    
-    # Highlight target word with distinct color, large size and glow effect
-    nx.draw_networkx_nodes(subgraph, pos, ax=ax, 
-                        nodelist=[target], 
-                        node_size=950,  # Same size as start
-                        node_color="#e74c3c",  # Red for target
-                        edgecolors="#ff8b81",  # Light red for glow effect
-                        linewidths=3.0)  # Thicker border
-    
-    # Improved network labels with better visibility and background
-    label_options = {
-        "font_size": 11,
-        "font_weight": "bold",
-        "font_color": "white",
-        "font_family": "Arial",
-        "bbox": {"boxstyle": "round,pad=0.3", "fc": "#333333", "ec": "#555555", "alpha": 0.8}
+        pos = nx.spring_layout(subgraph, seed=42)  # Fixed seed for consistent layout
+
+    return {
+        "start": start,
+        "target": target,
+        "path": path,
+        "suggested_path": suggested_path,
+        "show_suggested_path": show_suggested_path,
+        "subgraph": subgraph,
+        "pos": pos,
     }
-    nx.draw_networkx_labels(subgraph, pos, ax=ax, **label_options)
-    
-    # Set the title with improved styling
-    if len(word_path) > 0:
-        ax.set_title(f"Word Ladder: {word_path[0]} → {target}", 
-                   fontsize=15, 
-                   fontweight="bold", 
-                   color="white",
-                   pad=12)
-    else:
-        ax.set_title(f"Word Ladder: {start} → {target}", 
-                   fontsize=15, 
-                   fontweight="bold", 
-                   color="white",
-                   pad=12)
-    
-    # Create legend elements with larger markers and better colors
-    legend_elements = [
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#2ecc71", markeredgecolor="#87f5b3", 
-                  markersize=15, markeredgewidth=2, label='Start Word'),
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#e74c3c", markeredgecolor="#ff8b81", 
-                  markersize=15, markeredgewidth=2, label='Target Word'),
-    ]
-    
-    # Only add path elements to legend if there's a path
-    if path and len(path) > 1:
-        legend_elements.extend([
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#3584e4", markeredgecolor="#66a5ff", 
-                      markersize=15, markeredgewidth=2, label='Path Words'),
-            plt.Line2D([0], [0], color="#ffaa33", lw=4, label='Current Path')
-        ])
-        
-    # If there's a suggested path, add it to legend
-    if show_suggested_path and suggested_path:
-        legend_elements.append(
-            plt.Line2D([0], [0], color="#b366ff", lw=3, dashes=(5, 2), label='Suggested Path')
-        )
-    
-    # Add other words to legend
-    legend_elements.append(
-        plt.Line2D([0], [0], marker='o', color='w', markerfacecolor="#555555", markeredgecolor="#777777", 
-                  markersize=15, markeredgewidth=2, label='Other Words')
-    )
-    
-    # Place legend in the bottom right corner with enhanced visibility
-    legend = ax.legend(handles=legend_elements, 
-                      loc='lower right',  # Bottom right corner
-                      fontsize=10,  # Larger font
-                      frameon=True,
-                      framealpha=0.9,  # More opaque
-                      facecolor='#222222',  # Dark background
-                      edgecolor='#555555',  # Border color
-                      title="Legend",  # Add a title
-                      title_fontsize=12)  # Make title larger
-    
-    # Set legend title color to a bright color for visibility
-    legend.get_title().set_color('#ffcc00')  # Bright gold color
-    
-    # Set legend text color to white with improved spacing
-    for text in legend.get_texts():
-        text.set_color('white')
-    
-    # Add padding around the plot to ensure legend is fully visible
-    plt.subplots_adjust(right=0.85)
-    
-    # Hide axis
-    ax.axis('off')
-    current_figure.tight_layout()
-    
-    # Update the canvas
-    graph_canvas.draw()
+
+def draw_embedded_graph(scene):
+    """Draw a scene from compute_graph_scene on the embedded figure (Tk thread only)"""
+    global current_figure, current_animation, graph_view
+
+    # Stop any existing animation
+    if current_animation:
+        current_animation.event_source.stop()
+        current_animation = None
+
+    if current_figure is None:
+        current_figure = plt.figure(figsize=(4, 3.5), dpi=100)  # Reduced size from (6, 5)
+
+    # The figure's artists are kept between moves and only updated, see graph_view
+    if graph_view is None:
+        graph_view = GraphView(current_figure, graph_canvas, DARK_THEME["bg_color"])
+    graph_view.update(scene)
 
 def show_popup(title, message):
     popup = ctk.CTkToplevel(root)
@@ -531,6 +479,8 @@ def show_popup(title, message):
 
 def show_loading_screen(message):
     global loading_popup
+    # Replace rather than orphan a loading screen that is still open
+    hide_loading_screen()
     loading_popup = ctk.CTkToplevel(root)
     loading_popup.geometry("300x150")
     loading_popup.title("Loading...")
@@ -545,15 +495,19 @@ def show_loading_screen(message):
     progress.set(0.5)
 
 def hide_loading_screen():
-    loading_popup.destroy()
+    global loading_popup
+    if loading_popup is not None:
+        loading_popup.destroy()
+        loading_popup = None
 
 def apply_challenge_constraints():
     """Apply specific constraints for challenge mode games"""
-    global banned_letters, banned_words
+    global banned_letters, banned_words, move_constraints
     
     # Reset constraints
     banned_letters = []
     banned_words = []
+    move_constraints = None
     
     # Only apply constraints in Challenge mode
     mode = game_mode.get()
@@ -600,6 +554,9 @@ def apply_challenge_constraints():
         banned_letters = ['q', 'x', 'z']
         banned_words = []
         constraint_text = "⚔️ Challenge Rules:\n🚫 Cannot use letters: q, x, z"
+
+    # Built once per game so each move check is a couple of set lookups
+    move_constraints = SearchConstraints(banned_letters, banned_words)
     
     # Create a visually distinct constraint label
     constraints_label.configure(
@@ -620,160 +577,23 @@ def compare_algorithms():
     show_loading_screen("Comparing Algorithms...")
     
     def perform_comparison():
-        import time
-        results = {}
-        MAX_TIME = 5.0  # Maximum time in seconds to allow for each algorithm
-        
-        # Define the heuristic function here to ensure it's available
-        def heuristic(word, target):
-            """Heuristic function for A* search - returns number of differing letters"""
-            return sum(1 for a, b in zip(word, target) if a != b)
-        
-        # Create dictionaries to store g(n), h(n), and f(n) values for each algorithm and each node in the path
-        algorithm_functions = {
-            "BFS": {"paths": {}, "visited": set()},
-            "A*": {"paths": {}, "visited": set()},
-            "UCS": {"paths": {}, "visited": set()}
-        }
-        
-        # Function to run algorithm with timeout and track function values
-        def run_with_timeout(algorithm, algo_name):
-            start_time = time.time()
-            path = None
-            visited = set()
-            
-            try:
-                if algo_name == "BFS":
-                    # For BFS, g(n) is path length, h(n) is not used directly (we'll calculate it for comparison)
-                    visited = set([start])
-                    queue = deque([(start, [start], 0)])  # (word, path, depth/g-value)
-                    
-                    # Store g, h, f for start
-                    g_value = 0
-                    h_value = sum(1 for a, b in zip(start, target) if a != b)
-                    f_value = g_value  # BFS doesn't use f = g + h directly
-                    algorithm_functions[algo_name]["paths"][start] = {"g": g_value, "h": h_value, "f": f_value}
-                    
-                    iterations = 0
-                    while queue and iterations < 10000:
-                        iterations += 1
-                        current, path_so_far, g = queue.popleft()
-                        
-                        if current == target:
-                            path = path_so_far
-                            break
-                            
-                        # Get neighbors
-                        for neighbor in get_word_neighbors(current, word_list):
-                            if neighbor not in visited:
-                                visited.add(neighbor)
-                                new_g = g + 1
-                                new_h = sum(1 for a, b in zip(neighbor, target) if a != b)
-                                new_f = new_g  # BFS doesn't use f = g + h directly
-                                
-                                # Store function values
-                                algorithm_functions[algo_name]["paths"][neighbor] = {"g": new_g, "h": new_h, "f": new_f}
-                                
-                                queue.append((neighbor, path_so_far + [neighbor], new_g))
-                    
-                    algorithm_functions[algo_name]["visited"] = visited
-                
-                elif algo_name == "A*":
-                    # For A*, f(n) = g(n) + h(n)
-                    visited = set()
-                    
-                    # Store g, h, f for start
-                    g_value = 0
-                    h_value = heuristic(start, target)
-                    f_value = g_value + h_value
-                    algorithm_functions[algo_name]["paths"][start] = {"g": g_value, "h": h_value, "f": f_value}
-                    
-                    pq = [(f_value, g_value, start, [start])]  # (f(n), g(n), current_word, path)
-                    
-                    iterations = 0
-                    while pq and iterations < 10000:
-                        iterations += 1
-                        f, g, current, path_so_far = heapq.heappop(pq)
-                        
-                        if current == target:
-                            path = path_so_far
-                            break
-                            
-                        if current in visited:
-                            continue
-                            
-                        visited.add(current)
-                        
-                        # Get neighbors
-                        for neighbor in get_word_neighbors(current, word_list):
-                            if neighbor not in visited:
-                                new_g = g + 1
-                                new_h = heuristic(neighbor, target)
-                                new_f = new_g + new_h
-                                
-                                # Store function values
-                                algorithm_functions[algo_name]["paths"][neighbor] = {"g": new_g, "h": new_h, "f": new_f}
-                                
-                                heapq.heappush(pq, (new_f, new_g, neighbor, path_so_far + [neighbor]))
-                    
-                    algorithm_functions[algo_name]["visited"] = visited
-                
-                elif algo_name == "UCS":
-                    # For UCS, f(n) = g(n), h(n) is not used
-                    visited = set()
-                    
-                    # Store g, h, f for start
-                    g_value = 0
-                    h_value = heuristic(start, target)  # We'll calculate it for comparison
-                    f_value = g_value
-                    algorithm_functions[algo_name]["paths"][start] = {"g": g_value, "h": h_value, "f": f_value}
-                    
-                    pq = [(g_value, start, [start])]  # (cost/g-value, current_word, path)
-                    
-                    iterations = 0
-                    while pq and iterations < 10000:
-                        iterations += 1
-                        g, current, path_so_far = heapq.heappop(pq)
-                        
-                        if current == target:
-                            path = path_so_far
-                            break
-                            
-                        if current in visited:
-                            continue
-                            
-                        visited.add(current)
-                        
-                        # Get neighbors
-                        for neighbor in get_word_neighbors(current, word_list):
-                            if neighbor not in visited:
-                                new_g = g + 1
-                                new_h = heuristic(neighbor, target)  # We'll calculate it for comparison
-                                new_f = new_g
-                                
-                                # Store function values
-                                algorithm_functions[algo_name]["paths"][neighbor] = {"g": new_g, "h": new_h, "f": new_f}
-                                
-                                heapq.heappush(pq, (new_g, neighbor, path_so_far + [neighbor]))
-                    
-                    algorithm_functions[algo_name]["visited"] = visited
-                
-                time_taken = time.time() - start_time
-                
-                # If takes too long, consider it timed out
-                if time_taken > MAX_TIME:
-                    return {"path": None, "time": time_taken, "timeout": True, "visited": visited}
-                else:
-                    return {"path": path, "time": time_taken, "timeout": False, "visited": visited}
-                    
-            except Exception as e:
-                print(f"Error in {algo_name}: {str(e)}")
-                return {"path": None, "time": time.time() - start_time, "timeout": False, "error": str(e), "visited": visited}
-        
-        # Test algorithms
-        results["BFS"] = run_with_timeout(bfs_shortest_path, "BFS")
-        results["A*"] = run_with_timeout(a_star_search, "A*")
-        results["UCS"] = run_with_timeout(ucs_shortest_path, "UCS")
+        # All three solvers share one neighbor index; each records a g/h/f trace
+        try:
+            comparison = run_algorithm_comparison(start, target, word_list, max_time=5.0, max_iterations=50000)
+        except Exception as e:
+            print(f"Error comparing algorithms: {str(e)}")
+            comparison = None
+        # Widgets may only be created on the Tk thread
+        root.after(0, lambda: show_comparison(comparison))
+    
+    def show_comparison(comparison):
+        if comparison is None:
+            hide_loading_screen()
+            show_popup("Error", "Could not compare the algorithms.")
+            return
+        results = {algo_name: {"path": result.path, "time": result.elapsed, "visited": result.expanded,
+                               "trace": result.nodes}
+                   for algo_name, result in comparison.items()}
         
         hide_loading_screen()
         
@@ -935,7 +755,7 @@ def compare_algorithms():
             
             # Get algorithm data
             data = results[algo_name]
-            func_values = algorithm_functions[algo_name]["paths"]
+            func_values = data["trace"]
             
             # Algorithm title with color
             if algo_name == "BFS":
@@ -1020,9 +840,8 @@ def compare_algorithms():
                     word_label.grid(row=i+1, column=1, padx=10, pady=5, sticky="w")
                     
                     # Function values
-                    if word in func_values:
-                        values = func_values[word]
-                        
+                    values = func_values.get(word)
+                    if values is not None:
                         g_label = ctk.CTkLabel(table, text=str(values["g"]), font=("Arial", 12))
                         g_label.grid(row=i+1, column=2, padx=10, pady=5, sticky="w")
                         
@@ -1066,7 +885,7 @@ def compare_algorithms():
                 
                 # Visualize full graph button
                 if algo_name == "BFS":
-                    visited = algorithm_functions[algo_name]["visited"]
+                    visited = data["visited"]
                     viz_graph_btn = ctk.CTkButton(
                         buttons_frame, 
                         text=f"Show {algo_name} Graph", 
@@ -1079,7 +898,7 @@ def compare_algorithms():
                     )
                     viz_graph_btn.pack(side="right", padx=10)
                 else:
-                    visited = algorithm_functions[algo_name]["visited"]
+                    visited = data["visited"]
                     viz_graph_btn = ctk.CTkButton(
                         buttons_frame, 
                         text=f"Show {algo_name} Graph", 
@@ -1147,31 +966,33 @@ def custom_word_ladder():
             messagebox.showerror("Error", "Words must be the same length!")
             return
             
-        if start not in word_list:
+        if start not in dictionary:
             messagebox.showerror("Error", f"'{start}' is not in the dictionary!")
             return
             
-        if target not in word_list:
+        if target not in dictionary:
             messagebox.showerror("Error", f"'{target}' is not in the dictionary!")
             return
             
-        # Check if there's a path using BFS
-        path = bfs_shortest_path(start, target, word_list)
-        if not path:
+        # Check if there's a path using the precomputed connected components
+        if not same_component(start, target, dictionary):
             messagebox.showerror("Error", "No valid word ladder exists between these words!")
             return
             
         # Start game with custom words
         current_word.set(start)
         target_word.set(target)
-        global moves
+        global moves, word_list
         moves = 0
+        hint_scheduler.cancel()
+        word_list = dictionary.by_length(len(start))
         lbl_current.configure(text=f"{start}")
         lbl_target.configure(text=f"{target}")
         lbl_moves.configure(text=f"{moves}")
         
         # Update graph
         update_embedded_graph(start, target)
+        build_hint_oracle(target)
         
         custom_popup.destroy()
     
@@ -1262,26 +1083,10 @@ def update_validate_move():
     entry_word.delete(0, 'end')  # Clear the entry after submission
     
     # All the validation checks as before
-    if len(next_word) != len(current_word.get()):
-        flash_error_message("Words must be of the same length.")
-        return
-
-    if next_word not in word_list:
-        flash_error_message("This word is not in the dictionary.")
+    reason = validate_step(current_word.get(), next_word, word_list, move_constraints, target_word.get())
+    if reason != MOVE_OK:
+        flash_error_message(invalid_move_message(reason, next_word))
         return
-
-    if sum(1 for a, b in zip(current_word.get(), next_word) if a != b) != 1:
-        flash_error_message("Words must differ by only one letter.")
-        return
-
-    if game_mode.get() == "Challenge":
-        if next_word in banned_words:
-            flash_error_message(f"The word '{next_word}' is banned in this challenge.")
-            return
-        
-        if any(letter in banned_letters for letter in next_word):
-            flash_error_message(f"Cannot use banned letters: {', '.join(banned_letters)}")
-            return
     
     # Word is valid - proceed with the move
     old_word = current_word.get()
@@ -1849,7 +1654,13 @@ def create_game_ui():
 # Define these functions BEFORE root.mainloop() is called
 def clear_graph():
     """Clear the visualization graph"""
-    global current_figure, current_animation
+    global current_figure, current_animation, graph_generation, graph_view
+    graph_generation += 1  # Drop any render still in flight
+
+    # The next game's graph starts from a fresh set of artists
+    if graph_view is not None:
+        graph_view.close()
+        graph_view = None
     
     # Stop any existing animation
     if current_animation:
@@ -1968,8 +1779,14 @@ def visualize_algorithm_graph(start, target, algo_name, visited_nodes, path):
                               text_color="#ffcc00")  # Gold color
     formula_label.pack(pady=5)
     
+    # Level of detail: a sample of the visited words in columns by BFS depth,
+    # so searches that visit thousands of words stay quick to lay out and draw
+    exploration = layered_exploration(start, target, visited_nodes, path, word_list)
+    
     stats_label = ctk.CTkLabel(header_frame, 
-                            text=f"Nodes explored: {len(visited_nodes)} | Path length: {len(path)-1} steps",
+                            text=f"Nodes explored: {len(visited_nodes)} | Path length: {len(path)-1} steps"
+                                 + (f" | Showing {exploration['shown']} of {exploration['total']}"
+                                    if exploration["shown"] < exploration["total"] else ""),
                             font=("Arial", 12))
     stats_label.pack(pady=5)
     
@@ -1981,39 +1798,19 @@ def visualize_algorithm_graph(start, target, algo_name, visited_nodes, path):
     fig = plt.figure(figsize=(6, 5), dpi=100)
     fig.patch.set_facecolor(DARK_THEME["bg_color"])
     
-    # Create subgraph of visited nodes
-    subgraph = nx.Graph()
-    
-    # Add all visited nodes to the graph
-    for word in visited_nodes:
-        subgraph.add_node(word)
-    
-    # Add edges between neighboring words
-    for word in visited_nodes:
-        for neighbor in get_word_neighbors(word, word_list):
-            if neighbor in visited_nodes:
-                subgraph.add_edge(word, neighbor)
+    subgraph, pos = exploration["graph"], exploration["pos"]
     
     ax = fig.add_subplot(111)
     ax.set_facecolor(DARK_THEME["bg_color"])
     
-    # Layout adjustments based on graph size
-    if len(visited_nodes) < 50:
-        pos = nx.spring_layout(subgraph, seed=42)
-    else:
-        # For larger graphs, use fast layout
-        pos = nx.fruchterman_reingold_layout(subgraph, seed=42)
-    
     # Define node groups
     path_nodes = set(path[1:-1])  # Path nodes excluding start/target
-    unexplored = set(word_list) - visited_nodes  # All unvisited nodes
+    regular_nodes = set(subgraph.nodes()) - {start, target} - path_nodes
     
-    regular_nodes = visited_nodes - {start, target} - path_nodes
-    
-    # Draw regular visited nodes
+    # Draw regular visited nodes, smaller when there are many of them
     nx.draw_networkx_nodes(subgraph, pos, ax=ax, 
                         nodelist=list(regular_nodes), 
-                        node_size=350,
+                        node_size=350 if exploration["shown"] < 50 else 120,
                         node_color="#555555",
                         alpha=0.7,
                         edgecolors="#777777")
@@ -2026,7 +1823,7 @@ def visualize_algorithm_graph(start, target, algo_name, visited_nodes, path):
     
     # Draw path edges with animation
     if path and len(path) > 1:
-        path_edges = list(zip(path, path[1:]))
+        path_edges = [(u, v) for u, v in zip(path, path[1:]) if u in pos and v in pos]
         
         # Draw path nodes
         nx.draw_networkx_nodes(subgraph, pos, ax=ax, 
@@ -2058,24 +1855,23 @@ def visualize_algorithm_graph(start, target, algo_name, visited_nodes, path):
                         node_color="#e74c3c",
                         edgecolors="#ff8b81")
     
-    # Add labels to nodes, but only for a reasonable number of nodes
-    if len(visited_nodes) < 30:
-        # Create labels for all nodes
-        labels = {node: node for node in subgraph.nodes()}
-        nx.draw_networkx_labels(subgraph, pos, 
-                              labels=labels, 
-                              font_size=9,
-                              font_color="white",
-                              font_weight="bold")
-    else:
-        # If too many nodes, only label key nodes
-        key_nodes = {start, target} | set(path)
-        labels = {node: node for node in key_nodes}
-        nx.draw_networkx_labels(subgraph, pos, 
-                              labels=labels, 
-                              font_size=9,
-                              font_color="white",
-                              font_weight="bold")
+    # Labels for the key words plus a capped number of others
+    nx.draw_networkx_labels(subgraph, pos, ax=ax,
+                          labels=exploration["labels"], 
+                          font_size=9,
+                          font_color="white",
+                          font_weight="bold")
+    
+    # Under each column: its depth and how many of its words were left out
+    max_depth = int(max(x for x, _ in pos.values()))
+    for depth in range(max_depth + 1):
+        caption = f"depth {depth}"
+        if exploration["hidden"].get(depth):
+            caption += f"\n+{exploration['hidden'][depth]} more"
+        ax.text(depth, -0.62, caption, color="#aaaaaa", fontsize=8,
+                horizontalalignment="center", verticalalignment="top")
+    ax.set_xlim(-0.5, max_depth + 0.5)
+    ax.set_ylim(-0.8, 0.6)
     
     # Set title and hide axis
     ax.set_title(f"{algo_name} Search Path", color="white", fontsize=14)
@@ -1,11 +1,87 @@
 import networkx as nx
 import heapq
+from array import array
 from collections import deque
-from word_loader import load_words_from_pickle
+import os
+import sys
+import itertools
+import multiprocessing
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from word_loader import load_words_from_pickle, save_graph_artifact, open_graph_artifact, GRAPH_ARTIFACT, letter_mask
 import time
 
-# Cache for word transformations
-_transformation_cache = {}
+try:
+    import numpy as np
+except ImportError:  # Optional: graph building falls back to pure Python
+    np = None
+
+class NeighborCache:
+    """
+    Thread-safe LRU cache of neighbor sets.
+    Keys are (dictionary version, word), where every NeighborIndex gets its own
+    version number, so results for one word list are never served for another.
+    Least recently used entries are evicted once either the entry limit or the
+    approximate byte budget is exceeded.
+    """
+    def __init__(self, max_entries=100000, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (neighbors, approximate size in bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached neighbors for a key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, neighbors):
+        """Store neighbors for a key, evicting old entries to stay within budget"""
+        # The neighbor strings themselves are shared with the dictionary,
+        # so only the container, the key and the entry overhead are counted.
+        size = sys.getsizeof(neighbors) + sys.getsizeof(key[1]) + 100
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (neighbors, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return a snapshot of the cache counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+# Shared by every search, including the UI's hint threads
+neighbor_cache = NeighborCache()
 
 def is_valid_transformation(word1, word2):
     """
@@ -38,6 +114,205 @@ def get_valid_transformations(word, word_list):
     
     return neighbors
 
+class NeighborIndex:
+    """
+    Prebuilt wildcard-pattern index over a word list.
+    Every word is filed under one pattern per letter position (e.g. 'cat' under
+    '*at', 'c*t' and 'ca*'), so the neighbors of a word are simply the other
+    words sharing one of its patterns. Buckets are built once per word length,
+    the first time a word of that length is looked up.
+    A Dictionary loaded from the graph artifact needs no buckets: neighbors and
+    component labels are read from its memory-mapped CSR arrays by word id.
+    """
+    def __init__(self, word_list):
+        self.version = next(_dictionary_versions)
+        # Only a weak reference is kept where possible, so that dropping a word
+        # list also lets its index (and, via LRU eviction, its cache entries) go.
+        try:
+            self._word_list_ref = weakref.ref(word_list)
+        except TypeError:
+            self._word_list_ref = lambda: word_list
+        self._buckets = {}     # length -> {pattern: [words]}
+        self._components = {}  # length -> {word: component label}
+        self._clean_words = {} # (length, banned letters) -> frozenset of words without them
+        self._lock = threading.RLock()
+        self._csr = word_list.csr() if hasattr(word_list, "csr") else None
+
+    @property
+    def word_list(self):
+        """The indexed word list, or None once it has been garbage collected"""
+        return self._word_list_ref()
+
+    def _bucket_for(self, length):
+        """Return the pattern buckets for words of the given length, building them on first use"""
+        buckets = self._buckets.get(length)
+        if buckets is None:
+            with self._lock:
+                buckets = self._buckets.get(length)
+                if buckets is None:
+                    buckets = {}
+                    word_list = self.word_list
+                    # A Dictionary hands out one length directly; anything else is scanned
+                    if hasattr(word_list, "words_of_length"):
+                        words = word_list.words_of_length(length)
+                    else:
+                        words = [word for word in word_list if len(word) == length]
+                    for word in words:
+                        for i in range(length):
+                            buckets.setdefault(word[:i] + '*' + word[i+1:], []).append(word)
+                    self._buckets[length] = buckets
+        return buckets
+
+    def neighbors(self, word):
+        """Return all words in the index that differ from the given word by exactly one letter."""
+        if self._csr is not None:
+            word_list = self.word_list
+            word_id = word_list.word_id(word)
+            if word_id is None:
+                # Not a dictionary word, so it has no row; try every one-letter change
+                return get_valid_transformations(word, word_list)
+            offsets, targets, _ = self._csr
+            words = word_list.words_of_length(len(word))
+            first = word_list.length_ranges[len(word)][0]
+            return {words[other - first] for other in targets[offsets[word_id]:offsets[word_id + 1]]}
+
+        buckets = self._bucket_for(len(word))
+        neighbors = set()
+        for i in range(len(word)):
+            for candidate in buckets.get(word[:i] + '*' + word[i+1:], ()):
+                if candidate != word:
+                    neighbors.add(candidate)
+        return neighbors
+
+    def _label_components(self, length):
+        """Union-find over the pattern buckets: words sharing a pattern are connected"""
+        parent = {}
+
+        def find(word):
+            while parent[word] != word:
+                parent[word] = parent[parent[word]]  # Path halving
+                word = parent[word]
+            return word
+
+        for words in self._bucket_for(length).values():
+            root = words[0]
+            parent.setdefault(root, root)
+            root = find(root)
+            for word in words[1:]:
+                other = find(parent.setdefault(word, word))
+                if other != root:
+                    parent[other] = root
+
+        components = {word: find(word) for word in parent}
+        self._components[length] = components
+        return components
+
+    def _components_for(self, length):
+        """Return the component labels for words of the given length, computing them on first use"""
+        components = self._components.get(length)
+        if components is None:
+            with self._lock:
+                components = self._components.get(length)
+                if components is None:
+                    components = self._label_components(length)
+        return components
+
+    def component(self, word):
+        """Return the connected-component label of a word, or None if it is not in the index"""
+        if self._csr is not None:
+            word_id = self.word_list.word_id(word)
+            return None if word_id is None else self._csr[2][word_id]
+        return self._components_for(len(word)).get(word)
+
+    def words_without_letters(self, letters, length):
+        """
+        Return a frozenset of the words of one length that use none of the
+        letters, cached per (length, letters). A Dictionary filters its
+        id-aligned mask array in one vectorized pass; other word lists are
+        masked word by word, once.
+        """
+        key = (length, frozenset(letters))
+        words = self._clean_words.get(key)
+        if words is None:
+            with self._lock:
+                words = self._clean_words.get(key)
+                if words is None:
+                    word_list = self.word_list
+                    if hasattr(word_list, "words_without_letters"):
+                        words = frozenset(word_list.words_without_letters(letters, length))
+                    else:
+                        banned = letter_mask(letters)
+                        words = frozenset(word for word in self._components_for(length)
+                                          if not letter_mask(word) & banned)
+                    if len(self._clean_words) >= 32:
+                        self._clean_words.clear()  # Only a game's few ban sets are ever live
+                    self._clean_words[key] = words
+        return words
+
+    def prepare(self, length):
+        """Build the pattern buckets and component labels for one word length up front"""
+        if self._csr is not None:
+            self.word_list.words_of_length(length)  # Only the word bucket is decoded; the graph is mapped
+            return
+        self._bucket_for(length)
+        self._components_for(length)
+
+# Every NeighborIndex gets a new version number, used in neighbor cache keys
+_dictionary_versions = itertools.count(1)
+
+# One NeighborIndex per live word list, looked up by id(). The identity check
+# guards against a recycled id; entries are removed when their list is freed.
+_neighbor_indexes = {}
+_neighbor_indexes_lock = threading.Lock()
+# Lists and dicts can't be weakly referenced, so their index keeps them alive.
+# Only the MAX_STRONG_INDEXES most recently indexed ones are kept (oldest out).
+MAX_STRONG_INDEXES = 8
+_strong_index_keys = OrderedDict()  # id -> None, in indexing order
+
+def get_neighbor_index(word_list):
+    """Return the shared NeighborIndex for a word list, creating it on first use"""
+    # A by_length() view shares its Dictionary's index, and through it the
+    # mapped graph and the letter mask arrays
+    word_list = getattr(word_list, "dictionary", word_list)
+    key = id(word_list)
+    index = _neighbor_indexes.get(key)
+    if index is not None and index.word_list is word_list:
+        return index
+
+    with _neighbor_indexes_lock:
+        index = _neighbor_indexes.get(key)
+        if index is None or index.word_list is not word_list:
+            index = NeighborIndex(word_list)
+            _neighbor_indexes[key] = index
+            _strong_index_keys.pop(key, None)
+            try:
+                weakref.finalize(word_list, _forget_neighbor_index, key, index.version)
+            except TypeError:
+                _strong_index_keys[key] = None
+                while len(_strong_index_keys) > MAX_STRONG_INDEXES:
+                    old_key, _ = _strong_index_keys.popitem(last=False)
+                    _neighbor_indexes.pop(old_key, None)
+    return index
+
+def _forget_neighbor_index(key, version):
+    """Drop a registry entry once its word list has been garbage collected"""
+    with _neighbor_indexes_lock:
+        index = _neighbor_indexes.get(key)
+        if index is not None and index.version == version:
+            del _neighbor_indexes[key]
+
+def same_component(a, b, word_list):
+    """
+    Return True if a word ladder between a and b can exist in the word list.
+    Component labels are precomputed once per word length, so this is an O(1)
+    check that lets searches reject unreachable pairs without exploring.
+    """
+    if len(a) != len(b):
+        return False
+    index = get_neighbor_index(word_list)
+    component = index.component(a)
+    return component is not None and component == index.component(b)
+
 def build_graph_optimized(word_list):
     """
     Construct a graph where words are nodes, and edges exist between words 
@@ -50,49 +325,379 @@ def build_graph_optimized(word_list):
     for word in word_list:
         word_groups.setdefault(len(word), []).append(word)
 
-    # Connect words that differ by one letter within the same length group
+    # Connect words that differ by one letter within the same length group,
+    # found by grouping (vectorized when NumPy is available) instead of
+    # comparing every pair of words
     for length, words in word_groups.items():
-        for i, word in enumerate(words):
-            for j in range(i + 1, len(words)):  # Compare only forward to reduce checks
-                if is_valid_transformation(word, words[j]):
-                    graph.add_edge(word, words[j])
+        words.sort()
+        offsets, targets = bucket_csr(words)
+        for position, word in enumerate(words):
+            for other in targets[offsets[position]:offsets[position + 1]]:
+                if other > position:  # Each undirected edge once
+                    graph.add_edge(word, words[other])
 
     return graph
 
 def get_word_neighbors(word, word_list):
-    """Get valid one-letter transformations with caching"""
-    global _transformation_cache
-    
-    # Cache key is the word and the id of the word_list (since word lists change)
-    cache_key = (word, id(word_list))
-    
-    if cache_key in _transformation_cache:
-        return _transformation_cache[cache_key]
-    
-    # Calculate valid transformations using the optimized method
-    neighbors = get_valid_transformations(word, word_list)
-    
-    # Store in cache
-    _transformation_cache[cache_key] = neighbors
-    
+    """Get valid one-letter transformations, served from the shared LRU neighbor cache"""
+    index = get_neighbor_index(word_list)
+    cache_key = (index.version, word)
+
+    neighbors = neighbor_cache.get(cache_key)
+    if neighbors is None:
+        # Look the neighbors up in the prebuilt pattern index
+        neighbors = frozenset(index.neighbors(word))
+        neighbor_cache.put(cache_key, neighbors)
+
     return neighbors
 
+# Reason codes returned by validate_step
+MOVE_OK = "ok"
+MOVE_WRONG_LENGTH = "wrong_length"
+MOVE_NOT_IN_DICTIONARY = "not_in_dictionary"
+MOVE_NOT_ONE_LETTER = "not_one_letter"
+MOVE_BANNED_WORD = "banned_word"
+MOVE_BANNED_LETTER = "banned_letter"
+
+MOVE_MESSAGES = {
+    MOVE_OK: "Valid move.",
+    MOVE_WRONG_LENGTH: "Words must be of the same length.",
+    MOVE_NOT_IN_DICTIONARY: "This word is not in the dictionary.",
+    MOVE_NOT_ONE_LETTER: "Words must differ by only one letter.",
+    MOVE_BANNED_WORD: "This word is banned in this challenge.",
+    MOVE_BANNED_LETTER: "This word uses a banned letter.",
+}
+
+class SearchConstraints:
+    """
+    Challenge-mode rules for moves and searches:
+    banned_letters  - letters no word on the ladder may contain
+    banned_words    - words the ladder may not pass through
+    required_words  - words the ladder must pass through, in this order
+    max_length      - most moves the whole ladder may take
+    A search's own start and target (and the required words) are always allowed.
+    Banned letters are applied through the neighbor index, which keeps one
+    frozenset per (length, banned letters) of the words free of them (cut
+    from the Dictionary's aligned mask arrays), so a search only does set
+    lookups and filtering never copies the dictionary per search.
+    """
+    def __init__(self, banned_letters=(), banned_words=(), required_words=(), max_length=None):
+        self.banned_letters = frozenset(letter.lower() for letter in banned_letters)
+        self.banned_words = frozenset(banned_words)
+        self.required_words = tuple(required_words)
+        self.max_length = max_length
+        self.banned_mask = letter_mask(self.banned_letters)
+
+    def check(self, word, target=None):
+        """Return MOVE_OK, MOVE_BANNED_WORD or MOVE_BANNED_LETTER for a word (the target is always OK)"""
+        if word == target:
+            return MOVE_OK
+        if word in self.banned_words:
+            return MOVE_BANNED_WORD
+        if not self.banned_letters.isdisjoint(word):
+            return MOVE_BANNED_LETTER
+        return MOVE_OK
+
+    def word_filter(self, word_list, exempt=()):
+        """
+        Return a predicate allowed(word) for searching word_list, or None if
+        nothing is banned. Words in exempt (and the required words) always pass.
+        """
+        if not self.banned_mask and not self.banned_words:
+            return None
+        exempt = frozenset(exempt) | frozenset(self.required_words)
+        banned_words = self.banned_words - exempt
+        banned_letters = self.banned_letters
+        if not banned_letters:
+            def allowed(word):
+                return word not in banned_words
+            return allowed
+
+        index = get_neighbor_index(word_list)
+        clean_by_length = {}
+        for length in {len(word) for word in exempt}:
+            clean_by_length[length] = index.words_without_letters(banned_letters, length)
+
+        def allowed(word):
+            clean = clean_by_length.get(len(word))
+            if clean is None:
+                clean = clean_by_length[len(word)] = index.words_without_letters(banned_letters, len(word))
+            return (word in clean and word not in banned_words) or word in exempt
+        return allowed
+
+    def segments(self):
+        """The same bans without required words or a length cap, for searching one leg of the ladder"""
+        return SearchConstraints(self.banned_letters, self.banned_words)
+
+def _search_filters(constraints, start, target, word_list):
+    """Return (allowed predicate or None, max moves or None) for a search"""
+    if constraints is None:
+        return None, None
+    return constraints.word_filter(word_list, (start, target)), constraints.max_length
+
+def _solve_through(solver, start, target, word_list, constraints, observer=None, **options):
+    """
+    Solve a ladder that must visit constraints.required_words in order by
+    chaining one constrained search per leg, then apply the overall length cap.
+    """
+    waypoints = [start] + list(constraints.required_words) + [target]
+    leg_constraints = constraints.segments()
+    path = [start]
+    for leg_start, leg_target in zip(waypoints, waypoints[1:]):
+        if leg_start == leg_target:
+            continue
+        leg = solver(leg_start, leg_target, word_list, observer=observer, constraints=leg_constraints, **options)
+        if leg is None:
+            return None  # The leg already reported why to the observer
+        path.extend(leg[1:])
+
+    if constraints.max_length is not None and len(path) - 1 > constraints.max_length:
+        return _finish(observer, None, "no_path")
+    return _finish(observer, path, "found")
+
+def validate_step(current, next_word, word_list, constraints=None, target=None):
+    """
+    Check a single move and return one of the MOVE_* reason codes.
+    The common case is answered by one lookup in current's cached neighbor set,
+    which covers dictionary membership, equal length and the one-letter rule at
+    once; the individual rules are only checked to explain a rejected move.
+    Moving onto the target is never blocked by constraints.
+    """
+    if next_word in get_word_neighbors(current, word_list):
+        if constraints is None:
+            return MOVE_OK
+        return constraints.check(next_word, target)
+    if len(next_word) != len(current):
+        return MOVE_WRONG_LENGTH
+    if next_word not in word_list:
+        return MOVE_NOT_IN_DICTIONARY
+    return MOVE_NOT_ONE_LETTER
+
+class SearchObserver:
+    """
+    Receives events from the search functions when passed as observer=.
+    Every hook is a no-op here; subclasses override the ones they need.
+    g is the number of moves from the word where that search side started,
+    h the heuristic value if the algorithm computed one (otherwise None).
+    """
+    def on_start(self, algorithm, start, target, h=None):
+        pass
+
+    def on_expand(self, word, g):
+        pass
+
+    def on_enqueue(self, word, g, h=None):
+        pass
+
+    def on_frontier(self, size):
+        pass
+
+    def on_finish(self, path, status):
+        """
+        status is one of "found", "no_path", "not_in_dictionary", "unreachable",
+        "timeout", "iteration_limit" or "cancelled"
+        """
+        pass
+
+class SearchTrace:
+    """
+    Compact record of the words a search enqueued, kept as parallel columns:
+    words[i] was last enqueued with g[i], h[i] and f[i]. A word that is
+    enqueued again overwrites its row. The word -> row lookup is rebuilt
+    after unpickling, so traces stay small when sent between processes.
+    """
+    def __init__(self):
+        self.words = []
+        self.g = array('i')
+        self.h = array('i')
+        self.f = array('i')
+        self._rows = {}
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self._rows
+
+    def record(self, word, g, h, f):
+        row = self._rows.get(word)
+        if row is None:
+            self._rows[word] = len(self.words)
+            self.words.append(word)
+            self.g.append(g)
+            self.h.append(h)
+            self.f.append(f)
+        else:
+            self.g[row], self.h[row], self.f[row] = g, h, f
+
+    def get(self, word):
+        """Return {"g": ..., "h": ..., "f": ...} for a word, or None if it was never enqueued"""
+        row = self._rows.get(word)
+        if row is None:
+            return None
+        return {"g": self.g[row], "h": self.h[row], "f": self.f[row]}
+
+    def __getstate__(self):
+        return {"words": self.words, "g": self.g, "h": self.h, "f": self.f}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rows = {word: row for row, word in enumerate(self.words)}
+
+class SearchMetrics(SearchObserver):
+    """
+    Observer that counts hot-path events and times the search.
+    With record_nodes=True it also keeps g/h/f for every enqueued word (as a
+    SearchTrace) and the set of expanded words, which is what the algorithm
+    comparison displays.
+    """
+    def __init__(self, record_nodes=False):
+        self.record_nodes = record_nodes
+        self.algorithm = None
+        self.target = None
+        self.expansions = 0
+        self.enqueued = 0
+        self.peak_frontier = 0
+        self.elapsed = 0.0
+        self.status = None
+        self.path = None
+        self.nodes = SearchTrace()  # g/h/f per enqueued word (record_nodes only)
+        self.expanded = set()  # (record_nodes only)
+        self._start_time = None
+
+    def on_start(self, algorithm, start, target, h=None):
+        self.algorithm = algorithm
+        if self._start_time is None:
+            # Set once, so a ladder solved leg by leg is timed as a whole
+            self.target = target
+            self._start_time = time.perf_counter()
+        if self.record_nodes:
+            if h is None:
+                self.nodes.record(start, 0, heuristic(start, target), 0)
+            else:
+                self.nodes.record(start, 0, h, h)
+
+    def on_expand(self, word, g):
+        self.expansions += 1
+        if self.record_nodes:
+            self.expanded.add(word)
+
+    def on_enqueue(self, word, g, h=None):
+        self.enqueued += 1
+        if self.record_nodes:
+            if h is None:
+                # Not used by this algorithm, but shown for comparison
+                self.nodes.record(word, g, heuristic(word, self.target), g)
+            else:
+                self.nodes.record(word, g, h, g + h)
+
+    def on_frontier(self, size):
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def on_finish(self, path, status):
+        self.path = path
+        self.status = status
+        if self._start_time is not None:
+            self.elapsed = time.perf_counter() - self._start_time
+
+    def result(self):
+        """Package the collected numbers as a SearchResult"""
+        return SearchResult(self.algorithm, self.path, self.status, self.expansions, self.enqueued,
+                            self.peak_frontier, self.elapsed,
+                            nodes=self.nodes if self.record_nodes else None,
+                            expanded=self.expanded if self.record_nodes else None)
+
+class SearchResult:
+    """A found path (or None) together with the statistics of the search that produced it"""
+    def __init__(self, algorithm, path, status, expansions, enqueued, peak_frontier, elapsed,
+                 nodes=None, expanded=None):
+        self.algorithm = algorithm
+        self.path = path
+        self.status = status
+        self.expansions = expansions
+        self.enqueued = enqueued
+        self.peak_frontier = peak_frontier
+        self.elapsed = elapsed
+        self.nodes = nodes
+        self.expanded = expanded
+
+    @property
+    def found(self):
+        return self.path is not None
+
+    def as_dict(self):
+        """Return the statistics (without per-word records) as a plain dict"""
+        return {
+            "algorithm": self.algorithm,
+            "path": self.path,
+            "status": self.status,
+            "expansions": self.expansions,
+            "enqueued": self.enqueued,
+            "peak_frontier": self.peak_frontier,
+            "elapsed": self.elapsed,
+        }
+
+class CancellationToken:
+    """
+    Lets another thread stop a running search. Pass one as cancel= to a solver;
+    it gives up with status "cancelled" once cancel() is called or the optional
+    deadline (a time.monotonic() value) passes.
+    """
+    def __init__(self, deadline=None):
+        self.deadline = deadline
+        self._event = threading.Event()
+
+    @classmethod
+    def after(cls, seconds):
+        """Token that cancels itself the given number of seconds from now"""
+        return cls(time.monotonic() + seconds)
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self._event.set()
+            return True
+        return False
+
+def _finish(observer, path, status):
+    """Report the outcome to the observer (if any) and return the path"""
+    if observer is not None:
+        observer.on_finish(path, status)
+    return path
+
 # Optimized BFS implementation
-def optimized_bfs(start, target, word_list, max_depth=15, max_iterations=10000, max_time=5.0):
+def optimized_bfs(start, target, word_list, max_depth=15, max_iterations=10000, max_time=5.0, observer=None,
+                  cancel=None, constraints=None):
     """
     Optimized BFS with depth limit to prevent excessive searching.
     Added timeout and iteration limit to prevent hanging.
     """
-    import time
+    if constraints is not None and constraints.required_words:
+        return _solve_through(optimized_bfs, start, target, word_list, constraints, observer=observer,
+                              max_depth=max_depth, max_iterations=max_iterations, max_time=max_time, cancel=cancel)
+
     start_time = time.time()
+    if observer is not None:
+        observer.on_start("BFS", start, target)
     
     if start == target:
-        return [start]
+        return _finish(observer, [start], "found")
         
     # If words aren't in the list, return immediately
     if start not in word_list or target not in word_list:
-        return None
+        return _finish(observer, None, "not_in_dictionary")
+
+    # Unreachable pairs are rejected without searching
+    if not same_component(start, target, word_list):
+        return _finish(observer, None, "unreachable")
     
+    allowed, max_moves = _search_filters(constraints, start, target, word_list)
     visited = {start}
     queue = deque([(start, [start], 0)])  # (word, path, depth)
     iterations = 0
@@ -103,30 +708,142 @@ def optimized_bfs(start, target, word_list, max_depth=15, max_iterations=10000,
         # Check for timeout
         if time.time() - start_time > max_time:
             print(f"BFS search timed out after {iterations} iterations")
-            return None
+            return _finish(observer, None, "timeout")
+
+        if cancel is not None and cancel.cancelled:
+            return _finish(observer, None, "cancelled")
             
         current, path, depth = queue.popleft()
         
         # Abandon paths that are too long
-        if depth > max_depth:
+        if depth > max_depth or (max_moves is not None and depth >= max_moves):
             continue
+
+        if observer is not None:
+            observer.on_expand(current, depth)
             
         # Get neighbors through the cached function
         for neighbor in get_word_neighbors(current, word_list):
             if neighbor == target:
-                return path + [neighbor]
+                if observer is not None:
+                    observer.on_enqueue(neighbor, depth + 1)
+                return _finish(observer, path + [neighbor], "found")
                 
-            if neighbor not in visited:
+            if neighbor not in visited and (allowed is None or allowed(neighbor)):
                 visited.add(neighbor)
                 queue.append((neighbor, path + [neighbor], depth + 1))
+                if observer is not None:
+                    observer.on_enqueue(neighbor, depth + 1)
+
+        if observer is not None:
+            observer.on_frontier(len(queue))
     
     if iterations >= max_iterations:
         print(f"BFS search reached maximum iterations ({max_iterations})")
+        return _finish(observer, None, "iteration_limit")
         
-    return None  # No path found
+    return _finish(observer, None, "no_path")  # No path found
+
+def _expand_level(frontier, parents, depths, other_depths, word_list, observer=None, cancel=None, allowed=None):
+    """
+    Expand one full BFS level of one side of a bidirectional search.
+    Returns the next frontier and the best meeting word found (or None),
+    where "best" minimizes the combined depth from both ends.
+    A cancelled level stops early; the caller checks the token and gives up.
+    """
+    next_frontier = []
+    meeting, meeting_length = None, None
+    for current in frontier:
+        if cancel is not None and cancel.cancelled:
+            return next_frontier, None
+        depth = depths[current] + 1
+        if observer is not None:
+            observer.on_expand(current, depth - 1)
+        for neighbor in get_word_neighbors(current, word_list):
+            if neighbor in depths or (allowed is not None and not allowed(neighbor)):
+                continue
+            parents[neighbor] = current
+            depths[neighbor] = depth
+            if observer is not None:
+                observer.on_enqueue(neighbor, depth)
+            if neighbor in other_depths:
+                length = depth + other_depths[neighbor]
+                if meeting is None or length < meeting_length:
+                    meeting, meeting_length = neighbor, length
+            next_frontier.append(neighbor)
+    return next_frontier, meeting
+
+def bidirectional_bfs(start, target, word_list, max_time=5.0, observer=None, cancel=None, constraints=None):
+    """
+    Bidirectional BFS: grows one frontier from the start and one from the target,
+    always expanding the smaller frontier by a full level, until they meet.
+    Parent dicts replace per-node path copies; the path is rebuilt at the meeting word.
+    """
+    if constraints is not None and constraints.required_words:
+        return _solve_through(bidirectional_bfs, start, target, word_list, constraints, observer=observer,
+                              max_time=max_time, cancel=cancel)
+
+    start_time = time.time()
+    if observer is not None:
+        observer.on_start("BFS", start, target)
 
-# Create an alias for backward compatibility
-bfs_shortest_path = optimized_bfs
+    if start == target:
+        return _finish(observer, [start], "found")
+
+    # If words aren't in the list, return immediately
+    if start not in word_list or target not in word_list:
+        return _finish(observer, None, "not_in_dictionary")
+
+    # Unreachable pairs are rejected without searching
+    if not same_component(start, target, word_list):
+        return _finish(observer, None, "unreachable")
+
+    forward_parents, forward_depths = {start: None}, {start: 0}
+    backward_parents, backward_depths = {target: None}, {target: 0}
+    forward_frontier, backward_frontier = [start], [target]
+    allowed, max_moves = _search_filters(constraints, start, target, word_list)
+    levels = 0  # Levels expanded so far on both sides; any unmet path is longer than this
+
+    while forward_frontier and backward_frontier:
+        if max_moves is not None and levels >= max_moves:
+            break  # Nothing within the allowed number of moves
+        # Check for timeout
+        if time.time() - start_time > max_time:
+            print(f"Bidirectional BFS timed out after visiting {len(forward_depths) + len(backward_depths)} words")
+            return _finish(observer, None, "timeout")
+
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand_level(forward_frontier, forward_parents, forward_depths,
+                                                      backward_depths, word_list, observer, cancel, allowed)
+        else:
+            backward_frontier, meeting = _expand_level(backward_frontier, backward_parents, backward_depths,
+                                                       forward_depths, word_list, observer, cancel, allowed)
+        levels += 1
+
+        if cancel is not None and cancel.cancelled:
+            return _finish(observer, None, "cancelled")
+
+        if observer is not None:
+            observer.on_frontier(len(forward_frontier) + len(backward_frontier))
+
+        if meeting is not None:
+            # Walk back to the start, then forward to the target
+            path = []
+            word = meeting
+            while word is not None:
+                path.append(word)
+                word = forward_parents[word]
+            path.reverse()
+            word = backward_parents[meeting]
+            while word is not None:
+                path.append(word)
+                word = backward_parents[word]
+            return _finish(observer, path, "found")
+
+    return _finish(observer, None, "no_path")  # No path found
+
+# bfs_shortest_path is the name the UI and console game use for BFS hints
+bfs_shortest_path = bidirectional_bfs
 
 def heuristic(word, target):
     """
@@ -135,109 +852,709 @@ def heuristic(word, target):
     """
     return sum(1 for a, b in zip(word, target) if a != b)
 
-def a_star_search(start, target, word_list, max_iterations=10000, max_time=5.0):
+def refined_heuristic(word, target, word_list):
+    """
+    Letter-difference heuristic with a one-step lookahead.
+    A move can only lower the difference count by fixing one mismatched letter,
+    so if none of those single-letter fixes is a dictionary word, the first move
+    cannot make progress and at least one extra step is needed. This stays
+    admissible and consistent while pruning more of the search.
+    """
+    mismatches = [i for i, (a, b) in enumerate(zip(word, target)) if a != b]
+    for i in mismatches:
+        if word[:i] + target[i] + word[i+1:] in word_list:
+            return len(mismatches)
+    return len(mismatches) + 1 if mismatches else 0
+
+def _reconstruct_path(parents, word):
+    """Follow parent pointers back to the start and return the path"""
+    path = []
+    while word is not None:
+        path.append(word)
+        word = parents[word]
+    path.reverse()
+    return path
+
+def a_star_search(start, target, word_list, max_iterations=10000, max_time=5.0, refined=False, observer=None,
+                  cancel=None, constraints=None):
     """
     Finds the shortest path using A* search.
-    Uses g(n) = path cost, h(n) = heuristic (letter difference).
-    Added timeout and iteration limit to prevent hanging.
+    Uses g(n) = path cost, h(n) = heuristic (letter difference, or the
+    refined_heuristic lookahead when refined=True).
+    Keeps a g-score map and parent pointers instead of per-entry path copies,
+    skips stale heap entries lazily, and breaks f ties in favor of higher g.
+    max_iterations limits the number of expanded words.
     """
-    import time
+    if constraints is not None and constraints.required_words:
+        return _solve_through(a_star_search, start, target, word_list, constraints, observer=observer,
+                              max_iterations=max_iterations, max_time=max_time, refined=refined, cancel=cancel)
+
     start_time = time.time()
+    if refined:
+        estimate = lambda word: refined_heuristic(word, target, word_list)
+    else:
+        estimate = lambda word: heuristic(word, target)
+    if observer is not None:
+        observer.on_start("A*", start, target, estimate(start))
     
     if start not in word_list or target not in word_list:
-        return None  # Ensure words exist
+        return _finish(observer, None, "not_in_dictionary")  # Ensure words exist
 
-    # **Optimization: Reduce search space to words of the same length**
-    word_list = {word for word in word_list if len(word) == len(start)}
+    # Unreachable pairs are rejected without searching
+    if not same_component(start, target, word_list):
+        return _finish(observer, None, "unreachable")
 
-    # Priority queue for A* search (min-heap)
-    pq = [(heuristic(start, target), 0, start, [start])]  # (f(n), g(n), current_word, path)
-    visited = set()
+    allowed, max_moves = _search_filters(constraints, start, target, word_list)
+
+    # Priority queue for A* search (min-heap); -g makes deeper entries win f ties
+    pq = [(estimate(start), 0, start)]  # (f(n), -g(n), current_word)
+    g_scores = {start: 0}
+    parents = {start: None}
+    closed = set()
     iterations = 0
 
     while pq and iterations < max_iterations:
+        _, neg_g, current_word = heapq.heappop(pq)
+        g = -neg_g
+
+        # Lazy deletion: skip entries superseded by a cheaper path or already expanded
+        if current_word in closed or g > g_scores[current_word]:
+            continue
+
+        if current_word == target:
+            return _finish(observer, _reconstruct_path(parents, current_word), "found")  # Found the shortest path
+
         iterations += 1
-        
+
         # Check for timeout
         if time.time() - start_time > max_time:
             print(f"A* search timed out after {iterations} iterations")
-            return None
-            
-        _, g, current_word, path = heapq.heappop(pq)
+            return _finish(observer, None, "timeout")
 
-        if current_word == target:
-            return path  # Found the shortest path
+        if cancel is not None and cancel.cancelled:
+            return _finish(observer, None, "cancelled")
 
-        visited.add(current_word)
+        closed.add(current_word)
+        if observer is not None:
+            observer.on_expand(current_word, g)
+
+        for neighbor in get_word_neighbors(current_word, word_list):
+            new_g = g + 1
+            # The heuristic is consistent, so closed words already have their best g
+            if neighbor in closed or new_g >= g_scores.get(neighbor, new_g + 1):
+                continue
+            if allowed is not None and not allowed(neighbor):
+                continue
+            h = estimate(neighbor)
+            if max_moves is not None and new_g + h > max_moves:
+                continue  # h never overestimates, so this word can't finish within the cap
+            g_scores[neighbor] = new_g
+            parents[neighbor] = current_word
+            heapq.heappush(pq, (new_g + h, -new_g, neighbor))  # A* formula: f(n) = g(n) + h(n)
+            if observer is not None:
+                observer.on_enqueue(neighbor, new_g, h)
 
-        for neighbor in get_valid_transformations(current_word, word_list):
-            if neighbor not in visited:
-                f = g + 1 + heuristic(neighbor, target)  # A* formula: f(n) = g(n) + h(n)
-                heapq.heappush(pq, (f, g + 1, neighbor, path + [neighbor]))
+        if observer is not None:
+            observer.on_frontier(len(pq))
 
     if iterations >= max_iterations:
         print(f"A* search reached maximum iterations ({max_iterations})")
+        return _finish(observer, None, "iteration_limit")
     
-    return None  # No path found
+    return _finish(observer, None, "no_path")  # No path found
 
-def ucs_shortest_path(start, target, word_list, max_iterations=10000, max_time=5.0):
+def ucs_shortest_path(start, target, word_list, max_iterations=10000, max_time=5.0, observer=None, cancel=None,
+                      constraints=None):
     """
     Finds the shortest path from start to target using Uniform Cost Search (UCS).
     Uses g(n) = actual path cost. No heuristic function.
-    Added timeout and iteration limit to prevent hanging.
+    Added timeout and iteration limit to prevent hanging; max_iterations
+    limits the number of expanded words.
     """
-    import time
+    if constraints is not None and constraints.required_words:
+        return _solve_through(ucs_shortest_path, start, target, word_list, constraints, observer=observer,
+                              max_iterations=max_iterations, max_time=max_time, cancel=cancel)
+
     start_time = time.time()
+    if observer is not None:
+        observer.on_start("UCS", start, target)
     
     if start not in word_list or target not in word_list:
-        return None  # Ensure words exist
+        return _finish(observer, None, "not_in_dictionary")  # Ensure words exist
 
-    # **Optimization: Reduce search space to words of the same length**
-    word_list = {word for word in word_list if len(word) == len(start)}
+    # Unreachable pairs are rejected without searching
+    if not same_component(start, target, word_list):
+        return _finish(observer, None, "unreachable")
 
-    # Priority queue for UCS (min-heap)
-    pq = [(0, start, [start])]  # (cost, current_word, path)
+    allowed, max_moves = _search_filters(constraints, start, target, word_list)
+
+    # Priority queue for UCS (min-heap), with parent pointers instead of per-entry path copies
+    pq = [(0, start)]  # (cost, current_word)
+    g_scores = {start: 0}
+    parents = {start: None}
     visited = set()
     iterations = 0
 
     while pq and iterations < max_iterations:
+        g, current_word = heapq.heappop(pq)
+
+        # Lazy deletion: skip words already expanded at a lower cost
+        if current_word in visited:
+            continue
+
+        if current_word == target:
+            return _finish(observer, _reconstruct_path(parents, current_word), "found")  # Found the shortest path
+
         iterations += 1
         
         # Check for timeout
         if time.time() - start_time > max_time:
             print(f"UCS search timed out after {iterations} iterations")
-            return None
-            
-        g, current_word, path = heapq.heappop(pq)
+            return _finish(observer, None, "timeout")
 
-        if current_word == target:
-            return path  # Found the shortest path
+        if cancel is not None and cancel.cancelled:
+            return _finish(observer, None, "cancelled")
 
         visited.add(current_word)
+        if observer is not None:
+            observer.on_expand(current_word, g)
+
+        if max_moves is not None and g >= max_moves:
+            continue  # Any further word would exceed the move cap
 
-        for neighbor in get_valid_transformations(current_word, word_list):
-            if neighbor not in visited:
-                heapq.heappush(pq, (g + 1, neighbor, path + [neighbor]))
+        for neighbor in get_word_neighbors(current_word, word_list):
+            new_g = g + 1
+            # Only push a word again if this path to it is cheaper
+            if neighbor in visited or new_g >= g_scores.get(neighbor, new_g + 1):
+                continue
+            if allowed is not None and not allowed(neighbor):
+                continue
+            g_scores[neighbor] = new_g
+            parents[neighbor] = current_word
+            heapq.heappush(pq, (new_g, neighbor))
+            if observer is not None:
+                observer.on_enqueue(neighbor, new_g)
+
+        if observer is not None:
+            observer.on_frontier(len(pq))
 
     if iterations >= max_iterations:
         print(f"UCS search reached maximum iterations ({max_iterations})")
+        return _finish(observer, None, "iteration_limit")
     
-    return None  # No path found
+    return _finish(observer, None, "no_path")  # No path found
+
+# Solvers by the names the UI and CLI use
+SEARCH_ALGORITHMS = {
+    "BFS": bfs_shortest_path,
+    "A*": a_star_search,
+    "UCS": ucs_shortest_path,
+}
+
+def search(start, target, word_list, algorithm="BFS", metrics=None, record_nodes=False, **options):
+    """
+    Run one of the SEARCH_ALGORITHMS with instrumentation and return a SearchResult.
+    Pass a SearchMetrics (or subclass) as metrics to aggregate counters yourself;
+    other keyword options (max_time, max_iterations, cancel, ...) go to the solver.
+    """
+    if metrics is None:
+        metrics = SearchMetrics(record_nodes=record_nodes)
+    SEARCH_ALGORITHMS[algorithm](start, target, word_list, observer=metrics, **options)
+    return metrics.result()
+
+# The solvers shown side by side in the algorithm comparison. BFS is the
+# one-directional search here, so its g values count from the start word
+# like those of A* and UCS.
+COMPARISON_ALGORITHMS = {
+    "BFS": optimized_bfs,
+    "A*": a_star_search,
+    "UCS": ucs_shortest_path,
+}
+
+def _compare_one(algorithm, start, target, word_list, options):
+    metrics = SearchMetrics(record_nodes=True)
+    COMPARISON_ALGORITHMS[algorithm](start, target, word_list, observer=metrics, **options)
+    return metrics.result()
+
+# The word list of a comparison worker process, set by its initializer
+_comparison_word_list = None
+
+def _init_comparison_worker(words):
+    global _comparison_word_list
+    _comparison_word_list = words
+
+def _compare_in_worker(algorithm, start, target, options):
+    return _compare_one(algorithm, start, target, _comparison_word_list, options)
+
+def run_algorithm_comparison(start, target, word_list, algorithms=None, processes=False, **options):
+    """
+    Run several COMPARISON_ALGORITHMS on one pair and return {name: SearchResult},
+    each with its trace (nodes) and expanded words recorded.
+    The neighbor index for the pair's word length is built once up front, and
+    the searches share it and the neighbor cache, so each word's neighbors are
+    looked up once for all of them. With processes=True every algorithm runs
+    in its own spawned worker process, which is only handed the words of that
+    length. This pays off when the searches outlast starting the workers; as
+    with any spawned pool, the caller's main module must be safe to import.
+    Other keyword options (max_time, max_iterations, ...) go to every solver.
+    """
+    algorithms = list(algorithms or COMPARISON_ALGORITHMS)
+    if not processes:
+        if len(start) == len(target):
+            get_neighbor_index(word_list).prepare(len(start))
+        return {name: _compare_one(name, start, target, word_list, options) for name in algorithms}
+
+    if hasattr(word_list, "words_of_length"):
+        words = frozenset(word_list.words_of_length(len(start)))
+    else:
+        words = frozenset(word for word in word_list if len(word) == len(start))
+    # Spawned, not forked: the caller (the UI) has render and hint threads that
+    # may hold neighbor cache or index locks, which a fork would copy held
+    with ProcessPoolExecutor(len(algorithms), mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_comparison_worker, initargs=(words,)) as pool:
+        futures = {name: pool.submit(_compare_in_worker, name, start, target, options) for name in algorithms}
+        return {name: future.result() for name, future in futures.items()}
+
+class DistanceOracle:
+    """
+    Distances from every reachable word to one fixed target.
+    A single BFS outward from the target is run when the oracle is built
+    (words differing by one letter are mutual neighbors, so this is also the
+    reverse search). After that, next_move() answers a hint in O(degree) by
+    stepping to a neighbor that is exactly one step closer.
+    With constraints, banned words are never entered, so every hint follows
+    the challenge rules; required words and the length cap are not applied.
+    """
+    def __init__(self, target, word_list, max_time=5.0, constraints=None):
+        self.target = target
+        self.word_list = word_list
+        self.constraints = constraints
+        self.distances = {}
+        self.complete = True  # False if max_time cut the BFS short
+        allowed = constraints.word_filter(word_list, (target,)) if constraints is not None else None
+
+        if target not in word_list:
+            return
+
+        start_time = time.time()
+        self.distances[target] = 0
+        frontier = [target]
+        depth = 0
+        while frontier:
+            if time.time() - start_time > max_time:
+                print(f"Distance table for '{target}' timed out after {len(self.distances)} words")
+                self.complete = False
+                break
+            depth += 1
+            next_frontier = []
+            for word in frontier:
+                for neighbor in get_word_neighbors(word, word_list):
+                    if neighbor not in self.distances and (allowed is None or allowed(neighbor)):
+                        self.distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+    def distance(self, word):
+        """Return the number of moves from word to the target, or None if unknown/unreachable"""
+        distance = self.distances.get(word)
+        if distance is None and self.constraints is not None and word in self.word_list:
+            # Banned words are never entered, but the player can stand on one (e.g. the start word)
+            known = [self.distances[neighbor] for neighbor in get_word_neighbors(word, self.word_list)
+                     if neighbor in self.distances]
+            if known:
+                distance = min(known) + 1
+        return distance
+
+    def next_move(self, word):
+        """Return the best next word on the way to the target, or None"""
+        distance = self.distance(word)
+        if not distance:
+            return None
+        # Sorted so the same position always gets the same hint
+        for neighbor in sorted(get_word_neighbors(word, self.word_list)):
+            if self.distances.get(neighbor) == distance - 1:
+                return neighbor
+        return None
+
+    def path_from(self, word):
+        """Return a shortest path from word to the target, or None"""
+        if self.distance(word) is None:
+            return None
+        path = [word]
+        while path[-1] != self.target:
+            path.append(self.next_move(path[-1]))
+        return path
+
+def bucket_adjacency(words):
+    """
+    Return the sorted neighbor positions of every word in one sorted bucket of
+    equal-length words. For every letter position, words sharing the same
+    remaining letters are grouped together, and every group is a clique of
+    one-letter neighbors.
+    """
+    adjacency = [[] for _ in words]
+    length = len(words[0]) if words else 0
+    for i in range(length):
+        groups = {}
+        for position, word in enumerate(words):
+            groups.setdefault(word[:i] + word[i+1:], []).append(position)
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            for position in group:
+                neighbors = adjacency[position]
+                for other in group:
+                    if other != position:
+                        neighbors.append(other)
+    for neighbors in adjacency:
+        neighbors.sort()
+    return adjacency
+
+def _bucket_codes(words):
+    """Encode a bucket of equal-length words as an n x L matrix of character codes"""
+    length = len(words[0])
+    try:
+        return np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(len(words), length)
+    except UnicodeEncodeError:
+        return np.array([[ord(letter) for letter in word] for word in words], dtype=np.uint32)
+
+def bucket_csr_numpy(words, block_size=1 << 20):
+    """
+    NumPy version of bucket_adjacency, returning local CSR arrays
+    (offsets, targets) as uint32 ndarrays.
+    For each letter position, the n x (L-1) matrix of the remaining letters is
+    lexsorted and runs of equal rows are found with one vectorized comparison;
+    every run is a clique of one-letter neighbors. Cliques are expanded in
+    blocks of at most block_size pairs to bound memory.
+    """
+    count = len(words)
+    if count == 0:
+        return np.zeros(1, dtype=np.uint32), np.zeros(0, dtype=np.uint32)
+    codes = _bucket_codes(words)
+    length = codes.shape[1]
+
+    sources, destinations = [], []
+    for position in range(length):
+        keys = np.delete(codes, position, axis=1)
+        order = np.lexsort(keys.T[::-1]) if keys.shape[1] else np.arange(count)
+        ordered = keys[order]
+        same_as_previous = (ordered[1:] == ordered[:-1]).all(axis=1)
+        run_starts = np.flatnonzero(np.concatenate(([True], ~same_as_previous)))
+        run_sizes = np.diff(np.append(run_starts, count))
+
+        # Expand all runs of the same size at once: (runs, size, size) pairs minus the diagonal
+        for size in np.unique(run_sizes[run_sizes > 1]).tolist():
+            starts = run_starts[run_sizes == size]
+            runs_per_block = max(1, block_size // (size * size))
+            off_diagonal = ~np.eye(size, dtype=bool)
+            for block in range(0, len(starts), runs_per_block):
+                members = order[starts[block:block + runs_per_block, None] + np.arange(size)]
+                pair_sources = np.broadcast_to(members[:, :, None], members.shape + (size,))
+                pair_destinations = np.broadcast_to(members[:, None, :], members.shape[:1] + (size, size))
+                sources.append(pair_sources[:, off_diagonal].ravel())
+                destinations.append(pair_destinations[:, off_diagonal].ravel())
+
+    if not sources:
+        return np.zeros(count + 1, dtype=np.uint32), np.zeros(0, dtype=np.uint32)
+    sources = np.concatenate(sources)
+    destinations = np.concatenate(destinations)
+    order = np.lexsort((destinations, sources))
+    offsets = np.zeros(count + 1, dtype=np.uint32)
+    np.cumsum(np.bincount(sources, minlength=count), out=offsets[1:])
+    return offsets, destinations[order].astype(np.uint32)
+
+def bucket_csr(words, builder="auto"):
+    """
+    Return local CSR arrays (offsets, targets) for one sorted bucket of
+    equal-length words. builder is "python", "numpy", or "auto" (NumPy when
+    it is installed). Both produce identical, sorted neighbor lists.
+    """
+    if builder == "numpy" or (builder == "auto" and np is not None):
+        if np is None:
+            raise RuntimeError("The numpy graph builder needs NumPy installed")
+        offsets, targets = bucket_csr_numpy(words)
+        return array('I', offsets.tobytes()), array('I', targets.tobytes())
+    if builder not in ("auto", "python"):
+        raise ValueError(f"Unknown graph builder '{builder}'")
+
+    offsets = array('I', [0])
+    targets = array('I')
+    for neighbors in bucket_adjacency(words):
+        targets.extend(neighbors)
+        offsets.append(len(targets))
+    return offsets, targets
+
+def bucket_components(offsets, targets, first_label=0):
+    """
+    Label the connected components of one bucket given its local CSR arrays,
+    numbering them from first_label in position order.
+    Returns (labels, next unused label).
+    """
+    unlabeled = -1
+    count = len(offsets) - 1
+    components = [unlabeled] * count
+    label = first_label
+    for root in range(count):
+        if components[root] != unlabeled:
+            continue
+        components[root] = label
+        queue = deque([root])
+        while queue:
+            current = queue.popleft()
+            for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                if components[neighbor] == unlabeled:
+                    components[neighbor] = label
+                    queue.append(neighbor)
+        label += 1
+    return components, label
+
+class CompactWordGraph:
+    """
+    Word graph with integer word ids and CSR (compressed sparse row) adjacency.
+    Words are sorted by length and then alphabetically, so each length bucket
+    occupies a contiguous id range, and the neighbors of id i are
+    targets[offsets[i]:offsets[i+1]].
+    """
+    def __init__(self, words, offsets, targets, length_ranges, components=None, word_ids=None):
+        self.words = words                  # id -> word
+        self.offsets = offsets              # array('I') with len(words) + 1 entries
+        self.targets = targets              # array('I') of neighbor ids
+        self.length_ranges = length_ranges  # length -> (first_id, end_id)
+        # Anything with a dict-like get(word) works as the reverse lookup;
+        # a memory-mapped word table binary searches itself instead.
+        self._ids = word_ids if word_ids is not None else {word: word_id for word_id, word in enumerate(words)}
+        if components is None:
+            # Buckets never link to each other, so labelling the whole graph at once numbers
+            # the components exactly as labelling bucket by bucket does
+            components = array('I', bucket_components(offsets, targets)[0])
+        self.components = components
+
+    @classmethod
+    def from_words(cls, word_list, builder="auto"):
+        """
+        Build the graph from a word list in near-linear time, one length
+        bucket at a time (see bucket_csr; builder picks "python" or "numpy").
+        """
+        words = sorted(word_list, key=lambda word: (len(word), word))
+        offsets = array('I', [0])
+        targets = array('I')
+        components = array('I')
+        length_ranges = {}
+        label_count = 0
+
+        first = 0
+        while first < len(words):
+            length = len(words[first])
+            end = first
+            while end < len(words) and len(words[end]) == length:
+                end += 1
+            length_ranges[length] = (first, end)
+
+            bucket_offsets, bucket_targets = bucket_csr(words[first:end], builder)
+            bucket_labels, label_count = bucket_components(bucket_offsets, bucket_targets, label_count)
+            components.extend(bucket_labels)
+            base = len(targets)
+            offsets.extend(base + offset for offset in bucket_offsets[1:])
+            targets.extend(first + other for other in bucket_targets)
+            first = end
+
+        return cls(words, offsets, targets, length_ranges, components=components)
+
+    @classmethod
+    def load(cls, file_path=GRAPH_ARTIFACT):
+        """Memory-map a graph previously written with save()"""
+        artifact = open_graph_artifact(file_path)
+        return cls(artifact["words"], artifact["offsets"], artifact["targets"],
+                   artifact["length_ranges"], components=artifact["components"],
+                   word_ids=artifact["words"])
+
+    def save(self, file_path=GRAPH_ARTIFACT):
+        """Write the graph as a binary artifact that load() can memory-map"""
+        save_graph_artifact(self.words, self.length_ranges, self.offsets,
+                            self.targets, self.components, file_path)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return self._ids.get(word) is not None
+
+    @property
+    def edge_count(self):
+        """Number of undirected edges in the graph"""
+        return len(self.targets) // 2
+
+    def adjacency_nbytes(self):
+        """Memory used by the CSR arrays, in bytes"""
+        return (len(self.offsets) * self.offsets.itemsize
+                + len(self.targets) * self.targets.itemsize)
+
+    def word_id(self, word):
+        """Return the integer id of a word, or None if it is not in the graph"""
+        return self._ids.get(word)
+
+    def neighbor_ids(self, word_id):
+        """Return the ids of all one-letter neighbors of a word id"""
+        return self.targets[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def neighbors(self, word):
+        """Return all one-letter neighbors of a word"""
+        word_id = self._ids.get(word)
+        if word_id is None:
+            return []
+        return [self.words[other] for other in self.neighbor_ids(word_id)]
+
+    def same_component(self, start_id, target_id):
+        """Return True if a path between the two word ids exists"""
+        return self.components[start_id] == self.components[target_id]
+
+    def _reconstruct(self, parents, node):
+        """Follow parent pointers back to the start and return the id path"""
+        path = [node]
+        while parents[node] != -1:
+            node = parents[node]
+            path.append(node)
+        path.reverse()
+        return path
+
+    def bfs(self, start_id, target_id):
+        """Breadth-first search over word ids. Returns a list of ids or None."""
+        if start_id == target_id:
+            return [start_id]
+
+        offsets, targets = self.offsets, self.targets
+        parents = {start_id: -1}
+        queue = deque([start_id])
+
+        while queue:
+            current = queue.popleft()
+            for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = current
+                if neighbor == target_id:
+                    return self._reconstruct(parents, neighbor)
+                queue.append(neighbor)
+
+        return None
+
+    def a_star(self, start_id, target_id):
+        """A* search over word ids using the letter-difference heuristic. Returns a list of ids or None."""
+        words = self.words
+        target = words[target_id]
+        offsets, targets = self.offsets, self.targets
+
+        parents = {start_id: -1}
+        g_scores = {start_id: 0}
+        closed = set()
+        pq = [(heuristic(words[start_id], target), 0, start_id)]  # (f(n), g(n), word id)
+
+        while pq:
+            _, g, current = heapq.heappop(pq)
+            if current == target_id:
+                return self._reconstruct(parents, current)
+            if current in closed:
+                continue
+            closed.add(current)
+
+            for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                new_g = g + 1
+                if neighbor in closed or new_g >= g_scores.get(neighbor, new_g + 1):
+                    continue
+                g_scores[neighbor] = new_g
+                parents[neighbor] = current
+                heapq.heappush(pq, (new_g + heuristic(words[neighbor], target), new_g, neighbor))
+
+        return None
+
+    def ucs(self, start_id, target_id):
+        """Uniform Cost Search over word ids (every step costs 1). Returns a list of ids or None."""
+        offsets, targets = self.offsets, self.targets
+
+        parents = {start_id: -1}
+        g_scores = {start_id: 0}
+        closed = set()
+        pq = [(0, start_id)]  # (g(n), word id)
+
+        while pq:
+            g, current = heapq.heappop(pq)
+            if current == target_id:
+                return self._reconstruct(parents, current)
+            if current in closed:
+                continue
+            closed.add(current)
+
+            for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                new_g = g + 1
+                if neighbor in closed or new_g >= g_scores.get(neighbor, new_g + 1):
+                    continue
+                g_scores[neighbor] = new_g
+                parents[neighbor] = current
+                heapq.heappush(pq, (new_g, neighbor))
+
+        return None
+
+    def shortest_path(self, start, target, algorithm="bfs"):
+        """
+        Find a word ladder between two words with the chosen algorithm
+        ("bfs", "astar" or "ucs"). Returns a list of words or None.
+        """
+        start_id = self._ids.get(start)
+        target_id = self._ids.get(target)
+        if start_id is None or target_id is None:
+            return None
+        if not self.same_component(start_id, target_id):
+            return None
+
+        if algorithm == "bfs":
+            id_path = self.bfs(start_id, target_id)
+        elif algorithm == "astar":
+            id_path = self.a_star(start_id, target_id)
+        elif algorithm == "ucs":
+            id_path = self.ucs(start_id, target_id)
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+        if id_path is None:
+            return None
+        return [self.words[word_id] for word_id in id_path]
+
+_compact_graph = None
+
+def load_compact_graph(file_path=GRAPH_ARTIFACT):
+    """
+    Return the process-wide CompactWordGraph.
+    Maps the precomputed artifact when it exists (run word_loader.py to
+    produce it) and otherwise builds the graph from the pickled word list.
+    """
+    global _compact_graph
+    if _compact_graph is None:
+        if os.path.exists(file_path):
+            _compact_graph = CompactWordGraph.load(file_path)
+        else:
+            print(f"Graph artifact {file_path} not found, building graph from the word list.")
+            _compact_graph = CompactWordGraph.from_words(load_words_from_pickle())
+    return _compact_graph
 
 if __name__ == "__main__":
     word_list = load_words_from_pickle()
-    
-    # **Use only a subset of words (Optional)**
-    word_list = set(list(word_list)[:10000])  # Limit to 10,000 words for quick testing
 
-    print(f"Building graph for {len(word_list)} words...")
-    word_graph = build_graph_optimized(word_list)
-    print(f"Graph created with {len(word_graph.nodes)} nodes and {len(word_graph.edges)} edges.")
+    print(f"Building compact graph for {len(word_list)} words...")
+    build_start = time.time()
+    compact_graph = CompactWordGraph.from_words(word_list)
+    print(f"Compact graph created with {len(compact_graph)} nodes and {compact_graph.edge_count} edges "
+          f"in {time.time() - build_start:.2f}s ({compact_graph.adjacency_nbytes() / 1e6:.1f} MB of adjacency).")
 
     # Example BFS Test
     start_word = "cat"
     target_word = "dog"
-    
+
+    compact_path = compact_graph.shortest_path(start_word, target_word)
+    if compact_path:
+        print(f"Compact graph BFS Path from '{start_word}' to '{target_word}': {compact_path}")
+    else:
+        print(f"No compact graph path found from '{start_word}' to '{target_word}'.")
+
     bfs_path = optimized_bfs(start_word, target_word, word_list)
     if bfs_path:
         print(f"Optimized BFS Shortest Path from '{start_word}' to '{target_word}': {bfs_path}")
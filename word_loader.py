@@ -1,8 +1,31 @@
+import bisect
 import pickle
 import os
+import sys
+import mmap
+import struct
+import threading
+from array import array
 
-# Dictionary to cache words by length
-_words_by_length = {}
+try:
+    import numpy as np
+except ImportError:  # Optional: mask filtering falls back to a Python loop
+    np = None
+
+# Process-wide Dictionary, loaded on first use
+_dictionary = None
+
+# Precomputed graph artifact: word table + CSR adjacency + component ids
+# + letter masks (since version 2). All integers are little-endian uint32;
+# sections are 4-byte aligned. Words are UTF-8 records padded with NUL bytes
+# to a fixed width per length bucket (version 3; earlier files are ASCII,
+# where the width is always the word length).
+GRAPH_ARTIFACT = "word_graph.bin"
+ARTIFACT_MAGIC = b"WLGRAPH\0"
+ARTIFACT_VERSION = 3
+_ARTIFACT_HEADER = struct.Struct("<8sIIII")  # magic, version, word count, target count, length count
+_ARTIFACT_LENGTH = struct.Struct("<IIII")    # word length, first word id, word count, record width in bytes
+_ARTIFACT_LENGTH_V2 = struct.Struct("<III")  # word length, first word id, word count
 
 def load_filtered_dictionary(filename, min_length=3, max_length=8):
     """
@@ -37,25 +60,407 @@ def load_words_from_pickle(file_path="filtered_words.pkl"):
         print(f"Error loading words: {e}")
         return set()
 
+def letter_mask(letters):
+    """
+    Return the 26-bit set of letters a-z in a word (or any iterable of
+    letters); bit 0 is 'a'. Other characters are ignored.
+    """
+    mask = 0
+    for letter in letters:
+        offset = ord(letter) - 97
+        if 0 <= offset < 26:
+            mask |= 1 << offset
+    return mask
+
+def letter_masks(words):
+    """Return the letter mask of every word, in order, as a uint32 array"""
+    return array('I', map(letter_mask, words))
+
+class LengthView(frozenset):
+    """
+    Frozen set of the words of one length, as handed out by Dictionary.by_length().
+    It keeps a link to its Dictionary, so searches over the view still reach
+    the dictionary's letter mask arrays and mapped graph.
+    """
+    def __new__(cls, words, dictionary, length):
+        view = super().__new__(cls, words)
+        view.dictionary = dictionary
+        view.length = length
+        return view
+
+    def __reduce__(self):
+        # Sent to other processes as a plain frozenset; the mapping can't be pickled
+        return (frozenset, (frozenset(self),))
+
+class Dictionary:
+    """
+    Word list partitioned by length exactly once.
+    Each length keeps a sorted tuple and a frozenset of its words; the sorted
+    order (by length, then alphabetically) matches the word ids used by
+    CompactWordGraph and the graph artifact. A Dictionary behaves like a
+    read-only set, so it can be passed to the searches as a word_list, and so
+    can the frozen per-length views handed out by by_length().
+    Each length also has a uint32 array of letter masks aligned with its
+    sorted words (and so with the word ids), used to filter out banned
+    letters for a whole bucket at once.
+    A Dictionary read from the artifact keeps the mapping: a length bucket is
+    only decoded the first time it is used, and csr() hands the neighbor index
+    the mapped adjacency, so no per-process graph is built.
+    """
+    def __init__(self, words_by_length, masks_by_length=None, table=None, csr=None):
+        self._sorted = {length: tuple(sorted(words)) for length, words in words_by_length.items()}
+        self._views = {}
+        self._table = table  # Mapped word table that buckets not in _sorted are decoded from
+        self._csr = csr      # (offsets, targets, components) of the mapped artifact, or None
+        if table is not None:
+            self.length_ranges = dict(table.length_ranges)
+        else:
+            self.length_ranges = {}
+            first = 0
+            for length in sorted(self._sorted):
+                self.length_ranges[length] = (first, first + len(self._sorted[length]))
+                first += len(self._sorted[length])
+        self._count = sum(end - first for first, end in self.length_ranges.values())
+        # Masks come precomputed from the artifact; otherwise computed per length on first use
+        self._masks = dict(masks_by_length) if masks_by_length else {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_words(cls, words):
+        """Partition an iterable of words by length"""
+        words_by_length = {}
+        for word in words:
+            words_by_length.setdefault(len(word), []).append(word)
+        return cls(words_by_length)
+
+    @classmethod
+    def from_artifact(cls, file_path=GRAPH_ARTIFACT):
+        """
+        Map the already length-bucketed word table of a graph artifact.
+        Nothing is decoded up front; the word buckets, the letter masks and the
+        CSR adjacency are read from the mapping, so processes that load the
+        same artifact share it through the page cache.
+        """
+        artifact = open_graph_artifact(file_path)
+        table = artifact["words"]
+        masks_by_length = None
+        if artifact["masks"] is not None:
+            # Zero-copy slices of the mapped mask section, one per length bucket
+            masks_by_length = {length: artifact["masks"][first:end]
+                               for length, (first, end) in table.length_ranges.items()}
+        return cls({}, masks_by_length, table=table,
+                   csr=(artifact["offsets"], artifact["targets"], artifact["components"]))
+
+    def _bucket(self, length):
+        """Return the sorted words of one length, decoding them from the mapping on first use"""
+        words = self._sorted.get(length)
+        if words is None:
+            if self._table is None or length not in self.length_ranges:
+                return ()
+            with self._lock:
+                words = self._sorted.get(length)
+                if words is None:
+                    # Records are stored in id order, which is already sorted
+                    words = tuple(self._table.words_of_length(length))
+                    self._sorted[length] = words
+        return words
+
+    def __contains__(self, word):
+        return word in self.by_length(len(word))
+
+    def __iter__(self):
+        for length in self.lengths():
+            yield from self._bucket(length)
+
+    def __len__(self):
+        return self._count
+
+    def lengths(self):
+        """Return the word lengths present, in ascending order"""
+        return sorted(self.length_ranges)
+
+    def by_length(self, length):
+        """Return the LengthView of the words of the given length (the same object every call)"""
+        view = self._views.get(length)
+        if view is None:
+            words = self._bucket(length)
+            with self._lock:
+                view = self._views.get(length)
+                if view is None:
+                    view = LengthView(words, self, length)
+                    self._views[length] = view
+        return view
+
+    def words_of_length(self, length):
+        """Return the words of the given length as a sorted tuple"""
+        return self._bucket(length)
+
+    def word_id(self, word):
+        """Return the id of a word (its position in length-then-alphabetical order), or None"""
+        words = self._bucket(len(word))
+        position = bisect.bisect_left(words, word)
+        if position < len(words) and words[position] == word:
+            return self.length_ranges[len(word)][0] + position
+        return None
+
+    def csr(self):
+        """Return (offsets, targets, components) of the mapped artifact, or None if not loaded from one"""
+        return self._csr
+
+    def masks_of_length(self, length):
+        """Return the letter masks of the words of the given length, aligned with words_of_length()"""
+        masks = self._masks.get(length)
+        if masks is None:
+            masks = letter_masks(self._bucket(length))
+            self._masks[length] = masks
+        return masks
+
+    def words_without_letters(self, letters, length=None):
+        """
+        Return the words (of one length, or all lengths) using none of the given
+        letters. Each bucket is filtered with one AND over its mask array,
+        vectorized with NumPy when it is installed.
+        """
+        banned = letter_mask(letters)
+        lengths = [length] if length is not None else self.lengths()
+        result = []
+        for bucket_length in lengths:
+            words = self._bucket(bucket_length)
+            masks = self.masks_of_length(bucket_length)
+            if np is not None and len(words):
+                keep = np.flatnonzero((np.frombuffer(masks, dtype=np.uint32) & banned) == 0)
+                result.extend(words[i] for i in keep.tolist())
+            else:
+                result.extend(word for word, mask in zip(words, masks) if not mask & banned)
+        return result
+
+def load_dictionary(file_path=GRAPH_ARTIFACT, pickle_path="filtered_words.pkl"):
+    """
+    Return the process-wide Dictionary.
+    Reads the length-bucketed word table from the graph artifact when it
+    exists and falls back to the pickled word set otherwise.
+    """
+    global _dictionary
+    if _dictionary is None:
+        if os.path.exists(file_path):
+            _dictionary = Dictionary.from_artifact(file_path)
+            print(f"Loaded {len(_dictionary)} words from {file_path}.")
+        else:
+            _dictionary = Dictionary.from_words(load_words_from_pickle(pickle_path))
+    return _dictionary
+
 def get_words_by_length(length):
     """Efficiently retrieve only words of specified length"""
-    global _words_by_length
-    
-    # If we've already filtered words of this length, return them
-    if length in _words_by_length:
-        return _words_by_length[length]
-    
-    # Load all words
-    all_words = load_words_from_pickle()
-    
-    # Filter to only words of the specified length
-    filtered_words = {word for word in all_words if len(word) == length}
-    
-    # Cache for future use
-    _words_by_length[length] = filtered_words
-    
-    print(f"Filtered {len(filtered_words)} words of length {length}")
-    return filtered_words
+    return load_dictionary().by_length(length)
+
+def _pad4(size):
+    """Round a byte size up to the next multiple of 4"""
+    return (size + 3) & ~3
+
+def _uint32_array(values):
+    """Copy values into a little-endian uint32 array ready to be written"""
+    values = array('I', values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+def encode_word_bucket(words, length):
+    """
+    Encode one length bucket as fixed-width UTF-8 records.
+    Returns (record width, blob). ASCII buckets need no padding; otherwise
+    every record is NUL-padded to the longest encoding in the bucket. UTF-8
+    preserves code point order, so sorted words stay binary searchable.
+    """
+    encoded = [word.encode("utf-8") for word in words]
+    width = max(map(len, encoded), default=length)
+    if width == length:
+        return width, b"".join(encoded)
+    return width, b"".join(record.ljust(width, b"\0") for record in encoded)
+
+def write_graph_artifact(file_path, word_count, target_count, length_entries, word_chunks,
+                         offset_chunks, target_chunks, component_chunks, mask_chunks):
+    """
+    Assemble an artifact from its sections, each given as an iterable of
+    bytes-like chunks (uint32 sections already little-endian), so callers
+    can stream sections from disk instead of holding them in memory.
+    length_entries are (length, first id, count, record width) tuples.
+    The file is written to a temporary name and moved into place,
+    so processes that already mapped the old file are unaffected.
+    """
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, word_count, target_count,
+                                      len(length_entries)))
+        for entry in length_entries:
+            f.write(_ARTIFACT_LENGTH.pack(*entry))
+
+        blob_size = 0
+        for chunk in word_chunks:
+            f.write(chunk)
+            blob_size += len(chunk)
+        f.write(b"\0" * (_pad4(blob_size) - blob_size))
+
+        for chunks in (offset_chunks, target_chunks, component_chunks, mask_chunks):
+            for chunk in chunks:
+                f.write(chunk)
+    os.replace(tmp_path, file_path)
+    print(f"Graph artifact saved to {file_path}.")
+
+def save_graph_artifact(words, length_ranges, offsets, targets, components, file_path=GRAPH_ARTIFACT,
+                        masks=None):
+    """
+    Save a precomputed word graph as a versioned binary artifact.
+    Words must be sorted by length and then alphabetically, so each length
+    bucket is stored as fixed-width records that can be binary searched
+    in place. The letter masks are computed from the words unless given.
+    """
+    if masks is None:
+        masks = letter_masks(words)
+
+    length_entries = []
+    blobs = []
+    for length in sorted(length_ranges):
+        first, end = length_ranges[length]
+        width, blob = encode_word_bucket([words[word_id] for word_id in range(first, end)], length)
+        length_entries.append((length, first, end - first, width))
+        blobs.append(blob)
+
+    write_graph_artifact(file_path, len(words), len(targets), length_entries, blobs,
+                         [_uint32_array(offsets)], [_uint32_array(targets)],
+                         [_uint32_array(components)], [_uint32_array(masks)])
+
+class MappedWordTable:
+    """
+    Read-only id -> word table backed by a memory-mapped artifact.
+    Lookups by word binary search the fixed-width records of the word's
+    length bucket, so no per-word Python objects are created up front.
+    """
+    def __init__(self, buffer, blob_start, length_ranges, widths=None):
+        self._buffer = buffer
+        self.length_ranges = length_ranges
+        widths = widths or {}
+        self._buckets = []  # (first id, end id, word length, record width, byte offset of the bucket)
+        position = blob_start
+        for length in sorted(length_ranges):
+            first, end = length_ranges[length]
+            width = widths.get(length, length)
+            self._buckets.append((first, end, length, width, position))
+            position += (end - first) * width
+        self._count = max((end for _, end, _, _, _ in self._buckets), default=0)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, word_id):
+        for first, end, length, width, position in self._buckets:
+            if first <= word_id < end:
+                start = position + (word_id - first) * width
+                record = self._buffer[start:start + width]
+                if width != length:
+                    record = record.rstrip(b"\0")
+                return record.decode("utf-8")
+        raise IndexError(f"word id {word_id} out of range")
+
+    def __iter__(self):
+        for word_id in range(self._count):
+            yield self[word_id]
+
+    def __contains__(self, word):
+        # Binary search; the inherited fallback would decode every record
+        return self.get(word) is not None
+
+    def words_of_length(self, length):
+        """Decode one length bucket into a list of words"""
+        for first, end, bucket_length, width, position in self._buckets:
+            if bucket_length == length:
+                blob = self._buffer[position:position + (end - first) * width]
+                if width == length:
+                    blob = blob.decode("ascii")
+                    return [blob[i:i + length] for i in range(0, len(blob), length)]
+                return [blob[i:i + width].rstrip(b"\0").decode("utf-8") for i in range(0, len(blob), width)]
+        return []
+
+    def get(self, word, default=None):
+        """Return the id of a word, or default if it is not in the table"""
+        for first, end, length, width, position in self._buckets:
+            if length != len(word):
+                continue
+            key = word.encode("utf-8")
+            if len(key) > width:
+                return default
+            key = key.ljust(width, b"\0")
+            low, high = 0, end - first
+            while low < high:
+                mid = (low + high) // 2
+                start = position + mid * width
+                record = self._buffer[start:start + width]
+                if record < key:
+                    low = mid + 1
+                elif record > key:
+                    high = mid
+                else:
+                    return first + mid
+            return default
+        return default
+
+def _uint32_view(buffer, start, count):
+    """Return a zero-copy uint32 view over part of the buffer (copied only on big-endian hosts)"""
+    view = memoryview(buffer)[start:start + count * 4].cast('I')
+    if sys.byteorder != "little":
+        view = array('I', view)
+        view.byteswap()
+    return view
+
+def open_graph_artifact(file_path=GRAPH_ARTIFACT):
+    """
+    Memory-map a graph artifact written by save_graph_artifact.
+    Returns a dict with the word table, the CSR offsets/targets, the
+    component ids and the letter masks (None for a version 1 file, which is
+    still readable). Nothing is deserialized: the arrays are views straight
+    into the page cache, so every process mapping the file shares one copy.
+    """
+    with open(file_path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, word_count, target_count, length_count = _ARTIFACT_HEADER.unpack_from(buffer, 0)
+    if magic != ARTIFACT_MAGIC:
+        raise ValueError(f"{file_path} is not a word graph artifact")
+    if version not in (1, 2, ARTIFACT_VERSION):
+        raise ValueError(f"{file_path} has artifact version {version}, expected {ARTIFACT_VERSION}")
+
+    length_ranges = {}
+    widths = {}
+    position = _ARTIFACT_HEADER.size
+    for _ in range(length_count):
+        if version >= 3:
+            length, first, count, width = _ARTIFACT_LENGTH.unpack_from(buffer, position)
+            position += _ARTIFACT_LENGTH.size
+        else:
+            length, first, count = _ARTIFACT_LENGTH_V2.unpack_from(buffer, position)
+            width = length
+            position += _ARTIFACT_LENGTH_V2.size
+        length_ranges[length] = (first, first + count)
+        widths[length] = width
+
+    words = MappedWordTable(buffer, position, length_ranges, widths)
+    position += _pad4(sum((end - first) * widths[length] for length, (first, end) in length_ranges.items()))
+
+    offsets = _uint32_view(buffer, position, word_count + 1)
+    position += (word_count + 1) * 4
+    targets = _uint32_view(buffer, position, target_count)
+    position += target_count * 4
+    components = _uint32_view(buffer, position, word_count)
+    position += word_count * 4
+    masks = _uint32_view(buffer, position, word_count) if version >= 2 else None
+
+    return {
+        "words": words,
+        "length_ranges": length_ranges,
+        "offsets": offsets,
+        "targets": targets,
+        "components": components,
+        "masks": masks,
+    }
 
 if __name__ == "__main__":
     input_file = "words_alpha.txt"  # Ensure this file exists in your project folder
@@ -69,3 +474,12 @@ if __name__ == "__main__":
 
     # Step 3: Load words from pickle to verify
     loaded_words = load_words_from_pickle(output_file)
+
+    # Step 4: Stream the word list into a memory-mappable graph artifact
+    from dictionary_builder import build_artifact
+    build_artifact([input_file], GRAPH_ARTIFACT)
+
+    # Step 5: Map the artifact back to verify
+    from word_graph import CompactWordGraph
+    mapped_graph = CompactWordGraph.load(GRAPH_ARTIFACT)
+    print(f"Mapped graph with {len(mapped_graph)} words and {mapped_graph.edge_count} edges from {GRAPH_ARTIFACT}.")
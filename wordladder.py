@@ -0,0 +1,246 @@
+"""
+Command-line entry point for bulk word ladder queries.
+
+    python -m wordladder solve pairs.csv --algorithm astar > results.jsonl
+    cat pairs.jsonl | python -m wordladder solve --output-format csv
+    python -m wordladder solve nightly.csv --jobs 0 --unordered
+
+Pairs are read as CSV rows (start,target) or JSON lines
+({"start": ..., "target": ...}), solved against a single shared dictionary
+and neighbor index, and streamed out as they finish. With --jobs the pairs
+are sharded across a process pool instead of being solved one by one.
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import csv
+import gc
+import json
+import multiprocessing
+import sys
+import time
+from word_loader import load_dictionary
+from word_graph import bfs_shortest_path, a_star_search, ucs_shortest_path, get_neighbor_index
+
+SOLVERS = {
+    "bfs": bfs_shortest_path,
+    "astar": a_star_search,
+    "ucs": ucs_shortest_path,
+}
+
+RESULT_FIELDS = ["start", "target", "algorithm", "found", "steps", "path", "time_ms", "error"]
+
+def read_pairs(lines, input_format="auto"):
+    """
+    Yield (start, target) pairs from CSV or JSONL lines.
+    In "auto" mode every line is sniffed: lines starting with '{' are JSON,
+    anything else is CSV. Blank lines and a "start,target" header are skipped.
+    A malformed line yields (start, target, error) instead, with the line
+    number in the error, so it is reported like any other failed pair.
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        start = target = ""
+        try:
+            if input_format == "jsonl" or (input_format == "auto" and line.startswith("{")):
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+                start, target = record.get("start", ""), record.get("target", "")
+                missing = [key for key in ("start", "target") if key not in record]
+                if missing:
+                    raise ValueError(f"missing {' and '.join(repr(key) for key in missing)}")
+            else:
+                row = next(csv.reader([line]))
+                if len(row) < 2:
+                    raise ValueError(f"expected 'start,target', got: {line}")
+                start, target = row[0], row[1]
+                if start.strip().lower() == "start" and target.strip().lower() == "target":
+                    continue  # Header row
+            if not isinstance(start, str) or not isinstance(target, str):
+                raise ValueError("'start' and 'target' must be strings")
+        except ValueError as e:  # Includes json.JSONDecodeError and csv.Error
+            start = start.strip().lower() if isinstance(start, str) else ""
+            target = target.strip().lower() if isinstance(target, str) else ""
+            yield start, target, f"line {number}: {e}"
+            continue
+
+        yield start.strip().lower(), target.strip().lower()
+
+def solve_pair(start, target, word_list, algorithm="bfs", max_time=5.0, error=None):
+    """Solve one pair and return a result record (a pair read with an error is only reported)"""
+    result = {"start": start, "target": target, "algorithm": algorithm,
+              "found": False, "steps": None, "path": None, "time_ms": 0.0, "error": error}
+
+    if error is not None:
+        return result
+
+    if len(start) != len(target):
+        result["error"] = "Words must be of the same length"
+        return result
+    if start not in word_list or target not in word_list:
+        result["error"] = "Word not in dictionary"
+        return result
+
+    start_time = time.perf_counter()
+    path = SOLVERS[algorithm](start, target, word_list, max_time=max_time)
+    result["time_ms"] = round((time.perf_counter() - start_time) * 1000, 3)
+
+    if path:
+        result["found"] = True
+        result["steps"] = len(path) - 1
+        result["path"] = path
+    return result
+
+def solve_pairs(pairs, word_list, algorithm="bfs", max_time=5.0):
+    """Lazily solve a stream of pairs, yielding one result per pair in input order"""
+    for pair in pairs:
+        yield solve_pair(pair[0], pair[1], word_list, algorithm, max_time, *pair[2:])
+
+# Per-process state of pool workers, set before the pool forks (or by
+# _init_worker in freshly spawned processes)
+_worker_word_list = None
+_worker_algorithm = "bfs"
+_worker_max_time = 5.0
+
+def _init_worker(algorithm, max_time):
+    global _worker_word_list, _worker_algorithm, _worker_max_time
+    _worker_algorithm = algorithm
+    _worker_max_time = max_time
+    if _worker_word_list is None:
+        with contextlib.redirect_stdout(sys.stderr):
+            _worker_word_list = load_dictionary()
+
+def _solve_in_worker(pair):
+    return solve_pair(pair[0], pair[1], _worker_word_list, _worker_algorithm, _worker_max_time, *pair[2:])
+
+def _worker_ready():
+    return True
+
+def solve_in_worker(start, target, algorithm="bfs", max_time=5.0):
+    """Solve one pair in a make_solver_pool() worker, with the algorithm chosen per call"""
+    return solve_pair(start, target, _worker_word_list, algorithm, max_time)
+
+def make_solver_pool(word_list, processes, max_time=5.0):
+    """
+    Start a process pool for solving single pairs; submit solve_in_worker to it.
+    Forked workers inherit word_list, spawned ones load the dictionary. Every
+    worker is started before this returns: a pool started lazily would fork on
+    the first request, when the caller's threads may hold cache or index locks
+    that the children would inherit locked forever.
+    """
+    global _worker_word_list
+    _worker_word_list = word_list
+    try:
+        pool = concurrent.futures.ProcessPoolExecutor(processes, initializer=_init_worker,
+                                                      initargs=("bfs", max_time))
+        for future in [pool.submit(_worker_ready) for _ in range(processes)]:
+            future.result()
+    finally:
+        _worker_word_list = None
+    return pool
+
+def solve_pairs_parallel(pairs, word_list, algorithm="bfs", max_time=5.0, processes=None,
+                         chunksize=64, ordered=True):
+    """
+    Solve pairs across a multiprocessing pool, yielding results as they finish.
+    The word buckets for every length in the batch are decoded in the parent
+    first and frozen out of the garbage collector's reach, so forked workers
+    share them copy-on-write; the graph itself is the dictionary's mapped
+    artifact, which every worker shares through the page cache. Pairs are dispatched in chunks; with ordered=False
+    results stream out in completion order.
+    """
+    global _worker_word_list
+    pairs = list(pairs)
+
+    index = get_neighbor_index(word_list)
+    for length in sorted({len(pair[0]) for pair in pairs if len(pair) == 2 and len(pair[0]) == len(pair[1])}):
+        index.prepare(length)
+
+    _worker_word_list = word_list
+    gc.freeze()  # Keep the shared objects' pages untouched by collections in the workers
+    try:
+        with multiprocessing.Pool(processes, initializer=_init_worker,
+                                  initargs=(algorithm, max_time)) as pool:
+            mapper = pool.imap if ordered else pool.imap_unordered
+            yield from mapper(_solve_in_worker, pairs, chunksize)
+    finally:
+        gc.unfreeze()
+        _worker_word_list = None
+
+def write_results(results, stream, output_format="jsonl"):
+    """Write results as they arrive, flushing after each one. Returns (total, found)."""
+    writer = None
+    if output_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+
+    total = found = 0
+    for result in results:
+        total += 1
+        found += result["found"]
+        if writer is not None:
+            row = dict(result)
+            row["path"] = " ".join(result["path"]) if result["path"] else ""
+            writer.writerow(row)
+        else:
+            stream.write(json.dumps(result) + "\n")
+        stream.flush()
+    return total, found
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m wordladder",
+                                     description="Word Ladder batch tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    solve = subcommands.add_parser("solve", help="Solve start/target pairs from a file or stdin")
+    solve.add_argument("input", nargs="?", default="-",
+                       help="CSV or JSONL file of start/target pairs ('-' for stdin, the default)")
+    solve.add_argument("--format", dest="input_format", choices=["auto", "csv", "jsonl"], default="auto",
+                       help="Input format (default: sniff each line)")
+    solve.add_argument("--output", default="-", help="Where to write results ('-' for stdout, the default)")
+    solve.add_argument("--output-format", choices=["jsonl", "csv"], default="jsonl")
+    solve.add_argument("--algorithm", choices=sorted(SOLVERS), default="bfs")
+    solve.add_argument("--max-time", type=float, default=5.0, help="Time limit per pair in seconds")
+    solve.add_argument("--jobs", type=int, default=1,
+                       help="Worker processes (1 solves serially, 0 uses every core)")
+    solve.add_argument("--chunksize", type=int, default=64, help="Pairs sent to a worker at a time")
+    solve.add_argument("--unordered", action="store_true",
+                       help="Stream results in completion order instead of input order")
+    return parser
+
+def run_solve(args):
+    input_stream = sys.stdin if args.input == "-" else open(args.input, "r")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        # Progress and search diagnostics go to stderr so stdout stays machine-readable
+        with contextlib.redirect_stdout(sys.stderr):
+            word_list = load_dictionary()
+            start_time = time.time()
+            pairs = read_pairs(input_stream, args.input_format)
+            if args.jobs == 1:
+                results = solve_pairs(pairs, word_list, args.algorithm, args.max_time)
+            else:
+                results = solve_pairs_parallel(pairs, word_list, args.algorithm, args.max_time,
+                                               processes=args.jobs or None, chunksize=args.chunksize,
+                                               ordered=not args.unordered)
+            total, found = write_results(results, output_stream, args.output_format)
+            print(f"Solved {total} pairs ({found} with a ladder) in {time.time() - start_time:.2f}s.")
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    return 0
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "solve":
+        return run_solve(args)
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())